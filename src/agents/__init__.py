@@ -1,6 +1,6 @@
 """Content Mate Agents."""
 
-from src.agents.base import BaseAgent
+from src.agents.base import BaseAgent, render_request_context
 from src.agents.editor import EditorAgent
 from src.agents.planner import PlannerAgent
 from src.agents.researcher import ResearcherAgent
@@ -12,4 +12,5 @@ __all__ = [
     "PlannerAgent",
     "ResearcherAgent",
     "WriterAgent",
+    "render_request_context",
 ]
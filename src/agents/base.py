@@ -12,6 +12,29 @@ from pydantic import SecretStr
 from src.utils.config import settings
 
 
+def render_request_context(request: Any) -> str:
+    """Render the request fields every prompt builder shares.
+
+    The pipeline renders this once per run and stores it in the state, so
+    prompt builders do not re-format the same request fields.
+
+    Args:
+        request: Content request
+
+    Returns:
+        Newline-separated tone, language, audience and keyword lines
+    """
+    lines = [f"TONE: {request.tone}", f"LANGUAGE: {request.language}"]
+
+    if request.target_audience:
+        lines.append(f"TARGET AUDIENCE: {request.target_audience}")
+
+    if request.keywords:
+        lines.append(f"KEYWORDS TO INCLUDE: {', '.join(request.keywords)}")
+
+    return "\n".join(lines)
+
+
 class BaseAgent(ABC):
     """Base class for all ContentMate agents."""
 
@@ -36,6 +59,8 @@ class BaseAgent(ABC):
         self.temperature = temperature
         self.tools = tools or []
 
+        # langchain-anthropic caches its httpx clients per (base_url, timeout), so
+        # every agent built with the same timeout shares one connection pool.
         self.llm: Any = ChatAnthropic(
             model_name=self.model_name,
             temperature=self.temperature,
@@ -59,7 +84,7 @@ class BaseAgent(ABC):
         """Process the current state and return updated state.
 
         Args:
-            state: Current workflow state
+            state: Current workflow state (shared with the pipeline; do not mutate)
 
         Returns:
             Updated state dict
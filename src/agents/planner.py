@@ -1,14 +1,79 @@
 """Content Planner Agent - Creates structured outlines based on research."""
 
-import json
 import re
 from typing import Any
 
+import orjson
 from langchain_core.messages import HumanMessage
 
-from src.agents.base import BaseAgent
+from src.agents.base import BaseAgent, render_request_context
 from src.models.content import ContentOutline
 
+# Outline used when the response has nothing usable; callers get a deep copy
+_DEFAULT_OUTLINE = ContentOutline(
+    title="Content Outline",
+    hook="Engaging opening to capture reader attention.",
+    sections=[
+        {
+            "header": "Introduction",
+            "purpose": "Set the context",
+            "points": ["Introduce the topic", "Establish relevance"],
+        },
+        {
+            "header": "Main Content",
+            "purpose": "Core information",
+            "points": ["Key point 1", "Key point 2", "Key point 3"],
+        },
+        {
+            "header": "Conclusion",
+            "purpose": "Wrap up",
+            "points": ["Summary", "Call to action"],
+        },
+    ],
+    conclusion_points=["Key takeaway from the content"],
+    cta="Take the next step based on what you learned.",
+)
+
+
+def _extract_json_block(text: str) -> str | None:
+    """Find the first balanced ``{...}`` object embedded in text.
+
+    Scans once from the first opening brace, tracking nesting depth and skipping
+    braces inside JSON string literals.
+
+    Args:
+        text: Raw text that may contain a JSON object
+
+    Returns:
+        The object substring, or None when no balanced object is found
+    """
+    start = text.find("{")
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for index in range(start, len(text)):
+        char = text[index]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start : index + 1]
+
+    return None
+
 
 class PlannerAgent(BaseAgent):
     """Agent responsible for creating content outlines and structure."""
@@ -71,7 +136,9 @@ You must respond with a valid JSON object in this exact format:
             raise ValueError("No content request found in state")
 
         # Build the planning prompt
-        planning_prompt = self._build_planning_prompt(request, research)
+        planning_prompt = self._build_planning_prompt(
+            request, research, state.get("request_context")
+        )
 
         messages = [HumanMessage(content=planning_prompt)]
         response = await self.invoke(messages)
@@ -86,12 +153,15 @@ You must respond with a valid JSON object in this exact format:
             "messages": state.get("messages", []) + [response],
         }
 
-    def _build_planning_prompt(self, request: Any, research: Any) -> str:
+    def _build_planning_prompt(
+        self, request: Any, research: Any, request_context: str | None = None
+    ) -> str:
         """Build the planning prompt from request and research.
 
         Args:
             request: Original content request
             research: Research results from researcher agent
+            request_context: Pre-rendered shared request fields (rendered here if omitted)
 
         Returns:
             Formatted planning prompt
@@ -100,16 +170,9 @@ You must respond with a valid JSON object in this exact format:
             f"Create a detailed content outline for: {request.topic}",
             f"\nCONTENT TYPE: {request.content_type.value}",
             f"TARGET WORD COUNT: {request.word_count} words",
-            f"TONE: {request.tone}",
-            f"LANGUAGE: {request.language}",
+            request_context or render_request_context(request),
         ]
 
-        if request.target_audience:
-            prompt_parts.append(f"TARGET AUDIENCE: {request.target_audience}")
-
-        if request.keywords:
-            prompt_parts.append(f"KEYWORDS TO INCORPORATE: {', '.join(request.keywords)}")
-
         if research:
             prompt_parts.append("\n--- RESEARCH FINDINGS ---")
 
@@ -154,17 +217,29 @@ You must respond with a valid JSON object in this exact format:
         Returns:
             Structured ContentOutline
         """
+        # Nothing to parse: skip the JSON attempts and the line scan
+        if not content or content.isspace():
+            return _DEFAULT_OUTLINE.model_copy(deep=True)
+
         # Try to extract JSON from the response
         try:
             # First, try direct JSON parsing
-            data = json.loads(content)
-        except json.JSONDecodeError:
-            # Try to find JSON in the response
+            data = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Then the first balanced object inside surrounding text
+            block = _extract_json_block(content)
+            try:
+                data = orjson.loads(block) if block else None
+            except orjson.JSONDecodeError:
+                data = None
+
+        if data is None:
+            # Finally the widest brace-delimited span
             json_match = re.search(r"\{[\s\S]*\}", content)
             if json_match:
                 try:
-                    data = json.loads(json_match.group())
-                except json.JSONDecodeError:
+                    data = orjson.loads(json_match.group())
+                except orjson.JSONDecodeError:
                     # Fallback to basic parsing
                     return self._fallback_parse(content)
             else:
@@ -202,18 +277,22 @@ You must respond with a valid JSON object in this exact format:
             if not line:
                 continue
 
+            # Lowercase and look at the first character once per line
+            lower = line.lower()
+            first = line[0]
+
             # Try to extract title
-            if line.lower().startswith("title:"):
+            if lower.startswith("title:"):
                 title = line[6:].strip().strip('"')
-            elif "hook:" in line.lower():
+            elif "hook:" in lower:
                 hook = line.split(":", 1)[1].strip().strip('"')
-            elif line.startswith("#") or line.startswith("##"):
+            elif first == "#":
                 # New section header
                 header = line.lstrip("#").strip()
                 if current_section:
                     sections.append(current_section)
                 current_section = {"header": header, "purpose": "", "points": []}
-            elif line.startswith("-") or line.startswith("•") or line.startswith("*"):
+            elif first in "-•*":
                 point = line.lstrip("-•* ").strip()
                 if current_section:
                     current_section["points"].append(point)
@@ -221,30 +300,12 @@ You must respond with a valid JSON object in this exact format:
         if current_section:
             sections.append(current_section)
 
-        # If no sections found, create a basic structure
-        if not sections:
-            sections = [
-                {
-                    "header": "Introduction",
-                    "purpose": "Set the context",
-                    "points": ["Introduce the topic", "Establish relevance"],
-                },
-                {
-                    "header": "Main Content",
-                    "purpose": "Core information",
-                    "points": ["Key point 1", "Key point 2", "Key point 3"],
-                },
-                {
-                    "header": "Conclusion",
-                    "purpose": "Wrap up",
-                    "points": ["Summary", "Call to action"],
-                },
-            ]
-
-        return ContentOutline(
-            title=title,
-            hook=hook or "Engaging opening to capture reader attention.",
-            sections=sections,
-            conclusion_points=["Key takeaway from the content"],
-            cta="Take the next step based on what you learned.",
+        # Fill whatever was not found from the default outline
+        return _DEFAULT_OUTLINE.model_copy(
+            update={
+                "title": title,
+                "hook": hook or _DEFAULT_OUTLINE.hook,
+                **({"sections": sections} if sections else {}),
+            },
+            deep=True,
         )
@@ -97,7 +97,9 @@ Focus on information that would resonate with {request.target_audience or "the g
         result = ResearchResult()
 
         lines = content.split("\n")
-        current_section = None
+        sources: list[str] = []
+        # Bullet items go straight into the list of the current section
+        current_items: list[str] | None = None
 
         for line in lines:
             line = line.strip()
@@ -107,26 +109,17 @@ Focus on information that would resonate with {request.target_audience or "the g
             lower_line = line.lower()
 
             if "key fact" in lower_line or "main fact" in lower_line:
-                current_section = "facts"
+                current_items = result.key_facts
             elif "statistic" in lower_line or "data" in lower_line:
-                current_section = "statistics"
+                current_items = result.statistics
             elif "quote" in lower_line or "expert" in lower_line:
-                current_section = "quotes"
+                current_items = result.quotes
             elif "source" in lower_line:
-                current_section = "sources"
+                current_items = sources
             elif "competitor" in lower_line or "insight" in lower_line:
-                current_section = "competitors"
-            elif line.startswith("-") or line.startswith("•") or line.startswith("*"):
-                item = line.lstrip("-•* ").strip()
-                if current_section == "facts":
-                    result.key_facts.append(item)
-                elif current_section == "statistics":
-                    result.statistics.append(item)
-                elif current_section == "quotes":
-                    result.quotes.append(item)
-                elif current_section == "sources":
-                    result.sources.append({"text": item})
-                elif current_section == "competitors":
-                    result.competitor_insights.append(item)
+                current_items = result.competitor_insights
+            elif current_items is not None and line[0] in "-•*":
+                current_items.append(line.lstrip("-•* ").strip())
 
+        result.sources.extend({"text": source} for source in sources)
         return result
@@ -4,7 +4,7 @@ from typing import Any
 
 from langchain_core.messages import HumanMessage
 
-from src.agents.base import BaseAgent
+from src.agents.base import BaseAgent, render_request_context
 
 
 class WriterAgent(BaseAgent):
@@ -55,7 +55,9 @@ Always write content that provides genuine value to the reader."""
             raise ValueError("No content request found in state")
 
         # Build the writing prompt
-        writing_prompt = self._build_writing_prompt(request, research, outline)
+        writing_prompt = self._build_writing_prompt(
+            request, research, outline, state.get("request_context")
+        )
 
         messages = [HumanMessage(content=writing_prompt)]
         response = await self.invoke(messages)
@@ -68,13 +70,20 @@ Always write content that provides genuine value to the reader."""
             "messages": state.get("messages", []) + [response],
         }
 
-    def _build_writing_prompt(self, request: Any, research: Any, outline: Any) -> str:
+    def _build_writing_prompt(
+        self,
+        request: Any,
+        research: Any,
+        outline: Any,
+        request_context: str | None = None,
+    ) -> str:
         """Build the writing prompt from available information.
 
         Args:
             request: Original content request
             research: Research results
             outline: Content outline
+            request_context: Pre-rendered shared request fields (rendered here if omitted)
 
         Returns:
             Formatted writing prompt
@@ -82,16 +91,9 @@ Always write content that provides genuine value to the reader."""
         prompt_parts = [
             f"Please write a {request.content_type.value} about: {request.topic}",
             f"\nTARGET LENGTH: Approximately {request.word_count} words",
-            f"TONE: {request.tone}",
-            f"LANGUAGE: {request.language}",
+            request_context or render_request_context(request),
         ]
 
-        if request.target_audience:
-            prompt_parts.append(f"TARGET AUDIENCE: {request.target_audience}")
-
-        if request.keywords:
-            prompt_parts.append(f"KEYWORDS TO INCLUDE: {', '.join(request.keywords)}")
-
         if research:
             prompt_parts.append("\n--- RESEARCH FINDINGS ---")
             if research.key_facts:
@@ -1,13 +1,18 @@
 """Content generation API routes."""
 
+import asyncio
+import math
+import time
+from collections.abc import AsyncIterator
 from typing import Any
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException, Query
-from fastapi.responses import Response
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Request
+from fastapi.responses import Response, StreamingResponse
 from loguru import logger
 
-from src.models.content import ContentRequest, ContentResponse, ContentStatus
+from src.models.content import ContentRequest, ContentResponse, ContentStatus, ContentSummary
 from src.services.export_service import ExportFormat, ExportService
+from src.utils.config import settings
 from src.workflows.content_pipeline import generate_content
 
 router = APIRouter()
@@ -15,9 +20,90 @@ router = APIRouter()
 # In-memory storage for demo (use database in production)
 content_storage: dict[str, ContentResponse] = {}
 
+# content_id -> event set when that record changes, waking its status streams
+_content_updates: dict[str, asyncio.Event] = {}
+
+# Idle status streams send a comment this often so proxies keep them open
+STREAM_KEEPALIVE_SECONDS = 15.0
+
+_FINISHED_STATUSES = frozenset({ContentStatus.COMPLETED, ContentStatus.FAILED})
+
+# Position of each status in a run, so progress never moves backwards
+_STATUS_ORDER = {status: index for index, status in enumerate(ContentStatus)}
+
+# Characters of generated content included in each listing entry
+CONTENT_PREVIEW_CHARS = 500
+
+# Minimum spacing between generation requests from one client, so repeated
+# submits cannot queue duplicate pipeline runs
+GENERATION_MIN_INTERVAL_SECONDS = 2.0
+
+# Header identifying the end user behind a proxying client such as the
+# Streamlit server, which sends every user's requests from one host. Only
+# honoured from settings.trusted_proxy_hosts, since any caller can set it
+CLIENT_ID_HEADER = "X-Client-ID"
+
+# Throttle key -> monotonic time of its last accepted generation request.
+# Kept in process like content_storage, so each worker throttles the
+# requests it serves
+_last_generation_at: dict[str, float] = {}
+
+
+def _notify_update(content_id: str) -> None:
+    """Wake the status streams waiting on a content record.
+
+    Args:
+        content_id: Content ID whose record changed
+    """
+    event = _content_updates.pop(content_id, None)
+    if event is not None:
+        event.set()
+
+
+def _throttle_generation(http_request: Request) -> None:
+    """Reject a generation request that follows the client's previous one too closely.
+
+    Clients are told apart by their remote host. A trusted proxy may name the
+    user it forwards for in the ``X-Client-ID`` header.
+
+    Args:
+        http_request: Incoming HTTP request
+
+    Raises:
+        HTTPException: 429 with a ``Retry-After`` header if the client is too fast
+    """
+    host = http_request.client.host if http_request.client else "unknown"
+    client_id = http_request.headers.get(CLIENT_ID_HEADER)
+    if client_id and host in settings.trusted_proxy_hosts:
+        client = f"id:{host}:{client_id}"
+    else:
+        client = f"host:{host}"
+    now = time.monotonic()
+
+    last = _last_generation_at.get(client)
+    if last is not None and now - last < GENERATION_MIN_INTERVAL_SECONDS:
+        retry_after = GENERATION_MIN_INTERVAL_SECONDS - (now - last)
+        raise HTTPException(
+            status_code=429,
+            detail="Too many generation requests. Please wait before retrying.",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+
+    # Forget clients that have been quiet for a full interval
+    if len(_last_generation_at) > 1024:
+        for key, at in list(_last_generation_at.items()):
+            if now - at >= GENERATION_MIN_INTERVAL_SECONDS:
+                del _last_generation_at[key]
+
+    _last_generation_at[client] = now
+
 
 @router.post("/content/generate", response_model=ContentResponse)
-async def create_content(request: ContentRequest) -> ContentResponse:
+async def create_content(
+    request: ContentRequest,
+    http_request: Request,
+    force_refresh: bool = False,
+) -> ContentResponse:
     """Generate new content using the AI pipeline.
 
     This endpoint triggers the full content generation pipeline:
@@ -27,14 +113,17 @@ async def create_content(request: ContentRequest) -> ContentResponse:
 
     Args:
         request: Content generation request
+        http_request: Incoming HTTP request, used to throttle the client
+        force_refresh: Generate anew instead of reusing a cached response
 
     Returns:
         Generated content response
     """
+    _throttle_generation(http_request)
     logger.info(f"Content generation request: {request.topic}")
 
     try:
-        response = await generate_content(request)
+        response = await generate_content(request, use_cache=not force_refresh)
         content_storage[response.id] = response
         return response
     except Exception as e:
@@ -45,22 +134,30 @@ async def create_content(request: ContentRequest) -> ContentResponse:
 @router.post("/content/generate/async", response_model=dict)
 async def create_content_async(
     request: ContentRequest,
+    http_request: Request,
     background_tasks: BackgroundTasks,
+    use_cache: bool = False,
 ) -> dict[str, str]:
     """Start async content generation.
 
     Returns immediately with a content ID that can be used to check status.
+    Jobs run the pipeline even for a request seen before, unless ``use_cache``
+    is set.
 
     Args:
         request: Content generation request
+        http_request: Incoming HTTP request, used to throttle the client
         background_tasks: FastAPI background tasks
+        use_cache: Reuse a cached response for an equivalent request
 
     Returns:
         Content ID for status checking
     """
+    _throttle_generation(http_request)
+
     import uuid
 
-    content_id = str(uuid.uuid4())
+    content_id = uuid.uuid4().hex
 
     # Create placeholder response
     placeholder = ContentResponse(
@@ -70,16 +167,31 @@ async def create_content_async(
     )
     content_storage[content_id] = placeholder
 
+    async def publish_status(status: ContentStatus) -> None:
+        # Finishing is reported by storing the final response, not mid-run:
+        # a finished placeholder would end streams before the content lands
+        content = content_storage.get(content_id)
+        if (
+            status not in _FINISHED_STATUSES
+            and content is not None
+            and _STATUS_ORDER[status] > _STATUS_ORDER[content.status]
+        ):
+            content.status = status
+            _notify_update(content_id)
+
     # Start background generation
     async def generate_in_background() -> None:
         try:
-            response = await generate_content(request)
+            response = await generate_content(
+                request, on_status=publish_status, use_cache=use_cache
+            )
             # Update the ID to match our placeholder
             response.id = content_id
             content_storage[content_id] = response
         except Exception as e:
             logger.error(f"Background generation failed: {e}")
             content_storage[content_id].status = ContentStatus.FAILED
+        _notify_update(content_id)
 
     background_tasks.add_task(generate_in_background)
 
@@ -124,20 +236,93 @@ async def get_content_status(content_id: str) -> dict[str, Any]:
     }
 
 
-@router.get("/content", response_model=list[ContentResponse])
-async def list_content(limit: int = 10, offset: int = 0) -> list[ContentResponse]:
+@router.get("/content/{content_id}/stream")
+async def stream_content_status(content_id: str) -> StreamingResponse:
+    """Stream content generation progress as Server-Sent Events.
+
+    Sends the content record as a ``data:`` event whenever its status changes,
+    and closes the stream once generation has completed or failed.
+
+    Args:
+        content_id: Content ID
+
+    Returns:
+        ``text/event-stream`` response
+    """
+    if content_id not in content_storage:
+        raise HTTPException(status_code=404, detail="Content not found")
+
+    async def events() -> AsyncIterator[str]:
+        last_status: ContentStatus | None = None
+        while True:
+            # Register before reading, so an update made while this stream is
+            # suspended on a yield still wakes it
+            updated = _content_updates.setdefault(content_id, asyncio.Event())
+            content = content_storage.get(content_id)
+            if content is None or last_status in _FINISHED_STATUSES:
+                _content_updates.pop(content_id, None)
+                return
+            if content.status != last_status:
+                last_status = content.status
+                yield f"data: {content.model_dump_json()}\n\n"
+                continue
+            try:
+                await asyncio.wait_for(updated.wait(), timeout=STREAM_KEEPALIVE_SECONDS)
+            except TimeoutError:
+                yield ": keepalive\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+def _to_summary(content: ContentResponse) -> ContentSummary:
+    """Build a listing entry, keeping only a preview of the generated text.
+
+    Args:
+        content: Full content response
+
+    Returns:
+        Content summary
+    """
+    body = content.content
+    preview = None
+    if body is not None:
+        preview = body[:CONTENT_PREVIEW_CHARS]
+        if len(body) > CONTENT_PREVIEW_CHARS:
+            preview += "..."
+
+    return ContentSummary(
+        id=content.id,
+        status=content.status,
+        request=content.request,
+        content_preview=preview,
+        word_count=len(body.split()) if body else 0,
+        created_at=content.created_at,
+        completed_at=content.completed_at,
+        processing_time_seconds=content.processing_time_seconds,
+    )
+
+
+@router.get("/content", response_model=list[ContentSummary])
+async def list_content(limit: int = 10, offset: int = 0) -> list[ContentSummary]:
     """List all generated content.
 
+    Entries carry a short preview instead of the full text, outline and
+    research; fetch ``/content/{content_id}`` for those.
+
     Args:
         limit: Maximum number of results
         offset: Offset for pagination
 
     Returns:
-        List of content responses
+        List of content summaries
     """
     items = list(content_storage.values())
     items.sort(key=lambda x: x.created_at, reverse=True)
-    return items[offset : offset + limit]
+    return [_to_summary(item) for item in items[offset : offset + limit]]
 
 
 @router.delete("/content/{content_id}")
@@ -154,9 +339,36 @@ async def delete_content(content_id: str) -> dict[str, str]:
         raise HTTPException(status_code=404, detail="Content not found")
 
     del content_storage[content_id]
+    _notify_update(content_id)
     return {"message": "Content deleted", "content_id": content_id}
 
 
+def _get_exportable_content(content_id: str) -> ContentResponse:
+    """Look up content that has finished generating.
+
+    Args:
+        content_id: Content ID
+
+    Returns:
+        Completed content response
+
+    Raises:
+        HTTPException: 404 if the content does not exist, 400 if it is not completed
+    """
+    if content_id not in content_storage:
+        raise HTTPException(status_code=404, detail="Content not found")
+
+    content = content_storage[content_id]
+
+    if content.status != ContentStatus.COMPLETED:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Content is not ready for export. Status: {content.status.value}",
+        )
+
+    return content
+
+
 @router.get("/content/{content_id}/export")
 async def export_content(
     content_id: str,
@@ -181,16 +393,7 @@ async def export_content(
     Returns:
         Exported content as file download
     """
-    if content_id not in content_storage:
-        raise HTTPException(status_code=404, detail="Content not found")
-
-    content = content_storage[content_id]
-
-    if content.status != ContentStatus.COMPLETED:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Content is not ready for export. Status: {content.status.value}",
-        )
+    content = _get_exportable_content(content_id)
 
     try:
         exported = ExportService.export(content, format)
@@ -209,6 +412,38 @@ async def export_content(
         raise HTTPException(status_code=500, detail=f"Export failed: {str(e)}") from e
 
 
+@router.get("/content/{content_id}/export/bundle")
+async def export_content_bundle(content_id: str) -> Response:
+    """Export content to every format in a single ZIP download.
+
+    The archive holds ``content.md``, ``content.html``, ``content-print.html``
+    (the print-ready PDF export), ``content.json`` and ``content.txt``, so
+    clients offering all formats need one request instead of five.
+
+    Args:
+        content_id: Content ID
+
+    Returns:
+        ZIP archive as file download
+    """
+    content = _get_exportable_content(content_id)
+
+    try:
+        bundle = ExportService.export_bundle(content)
+        filename = ExportService.get_bundle_filename(content)
+
+        return Response(
+            content=bundle,
+            media_type="application/zip",
+            headers={
+                "Content-Disposition": f'attachment; filename="{filename}"',
+            },
+        )
+    except Exception as e:
+        logger.error(f"Export failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Export failed: {str(e)}") from e
+
+
 @router.get("/content/{content_id}/export/formats")
 async def get_export_formats() -> dict[str, list[dict[str, str]]]:
     """Get available export formats.
@@ -5,6 +5,7 @@ from src.models.content import (
     ContentRequest,
     ContentResponse,
     ContentStatus,
+    ContentSummary,
     ContentType,
     ResearchResult,
     SEOMetadata,
@@ -15,6 +16,7 @@ __all__ = [
     "ContentRequest",
     "ContentResponse",
     "ContentStatus",
+    "ContentSummary",
     "ContentType",
     "ResearchResult",
     "SEOMetadata",
@@ -90,3 +90,18 @@ class ContentResponse(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     completed_at: datetime | None = None
     processing_time_seconds: float | None = None
+
+
+class ContentSummary(BaseModel):
+    """Lightweight content listing entry: a preview instead of the full body."""
+
+    id: str
+    status: ContentStatus
+    request: ContentRequest
+    content_preview: str | None = Field(
+        default=None, description="Start of the generated content, ending in '...' if cut"
+    )
+    word_count: int = Field(default=0, description="Words in the full generated content")
+    created_at: datetime
+    completed_at: datetime | None = None
+    processing_time_seconds: float | None = None
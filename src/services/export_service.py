@@ -1,7 +1,9 @@
 """Content export service for various formats."""
 
 import html
+import io
 import re
+import zipfile
 from enum import Enum
 from typing import Any
 
@@ -23,6 +25,24 @@ class ExportFormat(str, Enum):
 class ExportService:
     """Service for exporting content to various formats."""
 
+    EXTENSIONS = {
+        ExportFormat.MARKDOWN: "md",
+        ExportFormat.HTML: "html",
+        ExportFormat.PDF: "pdf",
+        ExportFormat.JSON: "json",
+        ExportFormat.TXT: "txt",
+    }
+
+    # ZIP bundle entry per format, named after what the bytes really are: the
+    # PDF export is print-ready HTML, so it must not pose as a .pdf file
+    BUNDLE_ENTRIES = {
+        ExportFormat.MARKDOWN: "content.md",
+        ExportFormat.HTML: "content.html",
+        ExportFormat.PDF: "content-print.html",
+        ExportFormat.JSON: "content.json",
+        ExportFormat.TXT: "content.txt",
+    }
+
     @staticmethod
     def export(content: ContentResponse, format: ExportFormat) -> bytes:
         """Export content to the specified format.
@@ -47,6 +67,27 @@ class ExportService:
         else:
             raise ValueError(f"Unsupported export format: {format}")
 
+    @staticmethod
+    def export_bundle(content: ContentResponse) -> bytes:
+        """Export content to every format at once, packed in a ZIP archive.
+
+        Entries are named as in ``BUNDLE_ENTRIES``, one per export format.
+
+        Args:
+            content: Content response to export
+
+        Returns:
+            ZIP archive as bytes
+        """
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for format in ExportFormat:
+                archive.writestr(
+                    ExportService.BUNDLE_ENTRIES[format],
+                    ExportService.export(content, format),
+                )
+        return buffer.getvalue()
+
     @staticmethod
     def get_filename(content: ContentResponse, format: ExportFormat) -> str:
         """Generate a filename for the export.
@@ -58,20 +99,19 @@ class ExportService:
         Returns:
             Suggested filename
         """
-        # Create a slug from the topic
-        topic = content.request.topic[:50]
-        slug = re.sub(r"[^\w\s-]", "", topic.lower())
-        slug = re.sub(r"[-\s]+", "-", slug).strip("-")
-
-        extensions = {
-            ExportFormat.MARKDOWN: "md",
-            ExportFormat.HTML: "html",
-            ExportFormat.PDF: "pdf",
-            ExportFormat.JSON: "json",
-            ExportFormat.TXT: "txt",
-        }
+        return f"{ExportService._slugify(content)}.{ExportService.EXTENSIONS[format]}"
 
-        return f"{slug}.{extensions[format]}"
+    @staticmethod
+    def get_bundle_filename(content: ContentResponse) -> str:
+        """Generate a filename for the all-formats ZIP bundle.
+
+        Args:
+            content: Content response
+
+        Returns:
+            Suggested filename
+        """
+        return f"{ExportService._slugify(content)}.zip"
 
     @staticmethod
     def get_content_type(format: ExportFormat) -> str:
@@ -92,6 +132,20 @@ class ExportService:
         }
         return content_types[format]
 
+    @staticmethod
+    def _slugify(content: ContentResponse) -> str:
+        """Create a filename slug from the content topic.
+
+        Args:
+            content: Content response
+
+        Returns:
+            Lowercase, hyphen-separated slug
+        """
+        topic = content.request.topic[:50]
+        slug = re.sub(r"[^\w\s-]", "", topic.lower())
+        return re.sub(r"[-\s]+", "-", slug).strip("-")
+
     @staticmethod
     def _to_markdown(content: ContentResponse) -> bytes:
         """Convert content to Markdown format.
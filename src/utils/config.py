@@ -33,6 +33,9 @@ class Settings(BaseSettings):
     jwt_secret_key: str = "change-this-in-production"
     jwt_algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
+    # Hosts whose X-Client-ID header is trusted to name the user behind them,
+    # e.g. the Streamlit server; empty means every client is its own host
+    trusted_proxy_hosts: list[str] = []
 
     # MCP Servers
     mcp_fetch_server: str = "npx -y @anthropic/mcp-fetch"
@@ -42,6 +45,8 @@ class Settings(BaseSettings):
     default_llm_model: str = "claude-sonnet-4-20250514"
     max_tokens_per_request: int = 4096
     content_generation_timeout: int = 300
+    # Serve identical requests from the in-process response cache
+    response_cache_enabled: bool = True
 
     @property
     def is_development(self) -> bool:
@@ -32,10 +32,8 @@ class AgentError(ContentMateError):
         self.phase = phase
 
     def __str__(self) -> str:
-        base = f"[{self.agent_name}] {self.message}"
-        if self.phase:
-            base = f"[{self.agent_name}:{self.phase}] {self.message}"
-        return base
+        prefix = f"{self.agent_name}:{self.phase}" if self.phase else self.agent_name
+        return f"[{prefix}] {self.message}"
 
 
 class ResearchError(AgentError):
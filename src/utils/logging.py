@@ -1,13 +1,183 @@
 """Logging configuration for Content Mate."""
 
+import atexit
+import gzip
+import shutil
+import socket
 import sys
+import threading
+import traceback
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
+import orjson
 from loguru import logger
 
 from src.utils.config import settings
 
+# Block-buffer the log file instead of loguru's default line buffering
+LOG_FILE_BUFFER_SIZE = 64 * 1024
+
+# Rotated log files are gzipped here so rotation never waits on compression
+_compression_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-compress")
+
+# Fields shared by every JSON record, serialized once per process as an open object
+_JSON_RECORD_PREFIX = (
+    orjson.dumps(
+        {"service": "content-mate", "env": settings.app_env, "host": socket.gethostname()}
+    )[:-1]
+    + b","
+)
+
+# '"level":"INFO",' style fragments, filled in on first use of each level
+_JSON_LEVEL_FRAGMENTS: dict[str, bytes] = {}
+
+
+class BackgroundStreamWriter:
+    """Loguru sink that moves stream I/O off the logging caller's thread.
+
+    Formatted records are appended to a bounded in-memory buffer; a daemon
+    thread drains it in batches and writes each batch with a single call.
+    When the buffer is full the oldest records are dropped instead of
+    blocking the caller, and a warning with the number dropped is written
+    in their place. Pending records are flushed at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO,
+        max_buffered: int = 10_000,
+        serializer: Callable[[Any], str] | None = None,
+    ):
+        """Start the writer thread.
+
+        Args:
+            stream: Target stream (e.g. ``sys.stderr``)
+            max_buffered: Maximum number of records held before dropping the oldest
+            serializer: Optional function turning a loguru message into its output
+                line, run on the writer thread instead of the caller's
+        """
+        self.encoding = getattr(stream, "encoding", None)
+        self._stream = stream
+        self._serializer = serializer
+        self._buffer: deque[str] = deque(maxlen=max_buffered)
+        self._dropped = 0
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+        # The daemon thread would otherwise be killed with records still buffered
+        atexit.register(self.stop)
+
+    def write(self, message: str) -> None:
+        """Queue a formatted record (called by loguru)."""
+        with self._condition:
+            if len(self._buffer) == self._buffer.maxlen:
+                self._dropped += 1
+            self._buffer.append(message)
+            self._condition.notify()
+
+    def stop(self) -> None:
+        """Flush pending records and stop the writer thread (called by loguru on remove)."""
+        atexit.unregister(self.stop)
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+
+    def _dropped_notice(self, count: int) -> str:
+        """Format the warning written in place of records dropped from a full buffer.
+
+        Args:
+            count: Number of records dropped
+
+        Returns:
+            Output line, in JSON when the writer serializes records
+        """
+        now = datetime.now().astimezone()
+        message = f"Log buffer full: dropped {count} records"
+        if self._serializer is not None:
+            fields = {"time": now.isoformat(), "message": message, "logger": __name__}
+            body = orjson.dumps(fields, option=orjson.OPT_APPEND_NEWLINE)
+            return (_JSON_RECORD_PREFIX + b'"level":"WARNING",' + body[1:]).decode()
+        return f"{now:%Y-%m-%d %H:%M:%S} | WARNING  | {__name__} | {message}\n"
+
+    def _run(self) -> None:
+        """Drain buffered records until stopped."""
+        while True:
+            with self._condition:
+                while not self._buffer and not self._closed:
+                    self._condition.wait()
+                records = list(self._buffer)
+                self._buffer.clear()
+                dropped, self._dropped = self._dropped, 0
+                closed = self._closed
+
+            batch = "".join(map(self._serializer, records) if self._serializer else records)
+            if dropped:
+                batch = self._dropped_notice(dropped) + batch
+            if batch:
+                self._stream.write(batch)
+                self._stream.flush()
+            if closed:
+                return
+
+
+def _serialize_record(message: Any) -> str:
+    """Render a loguru message as a single JSON line using orjson.
+
+    Args:
+        message: Loguru message passed to the sink (carries ``.record``)
+
+    Returns:
+        JSON object terminated by a newline
+    """
+    record = message.record
+    level = record["level"].name
+    level_fragment = _JSON_LEVEL_FRAGMENTS.get(level)
+    if level_fragment is None:
+        level_fragment = _JSON_LEVEL_FRAGMENTS[level] = b'"level":' + orjson.dumps(level) + b","
+
+    fields = {
+        "time": record["time"].isoformat(),
+        "message": record["message"],
+        "logger": record["name"],
+        "function": record["function"],
+        "line": record["line"],
+    }
+    # Nested so a bound key can never collide with a base field or the prefix
+    if record["extra"]:
+        fields["extra"] = record["extra"]
+    exception = record["exception"]
+    if exception is not None:
+        fields["exception"] = "".join(
+            traceback.format_exception(exception.type, exception.value, exception.traceback)
+        )
+
+    body = orjson.dumps(fields, default=str, option=orjson.OPT_APPEND_NEWLINE)
+    # Splice the cached prefix and level into the object in place of its opening brace
+    return (_JSON_RECORD_PREFIX + level_fragment + body[1:]).decode()
+
+
+def _gzip_file(path: str) -> None:
+    """Gzip a log file next to itself and remove the original."""
+    with open(path, "rb") as src, gzip.open(f"{path}.gz", "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    Path(path).unlink()
+
+
+def _compress_in_background(path: str) -> None:
+    """Loguru compression hook that gzips rotated files off the logging thread."""
+    try:
+        _compression_executor.submit(_gzip_file, path)
+    except RuntimeError:
+        # Executor is already shut down (interpreter exit): compress inline
+        _gzip_file(path)
+
 
 def setup_logging(
     log_level: str = "INFO",
@@ -24,26 +194,27 @@ def setup_logging(
     # Remove default handler
     logger.remove()
 
-    # Console format
+    # Add console handler (written from a background thread)
     if json_format:
-        console_format = "{message}"
+        logger.add(
+            BackgroundStreamWriter(sys.stderr, serializer=_serialize_record),
+            format="{message}",
+            level=log_level,
+            colorize=False,
+        )
     else:
-        console_format = (
-            "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
-            "<level>{level: <8}</level> | "
-            "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
-            "<level>{message}</level>"
+        logger.add(
+            BackgroundStreamWriter(sys.stderr),
+            format=(
+                "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
+                "<level>{level: <8}</level> | "
+                "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
+                "<level>{message}</level>"
+            ),
+            level=log_level,
+            colorize=True,
         )
 
-    # Add console handler
-    logger.add(
-        sys.stderr,
-        format=console_format,
-        level=log_level,
-        colorize=not json_format,
-        serialize=json_format,
-    )
-
     # Add file handler if specified
     if log_file:
         log_path = Path(log_file)
@@ -55,7 +226,9 @@ def setup_logging(
             level=log_level,
             rotation="10 MB",
             retention="7 days",
-            compression="gz",
+            compression=_compress_in_background,
+            enqueue=True,
+            buffering=LOG_FILE_BUFFER_SIZE,
         )
 
     logger.info(f"Logging configured: level={log_level}, json={json_format}")
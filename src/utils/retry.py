@@ -7,6 +7,8 @@ from typing import Any, TypeVar
 
 from loguru import logger
 
+from src.utils.exceptions import ValidationError
+
 T = TypeVar("T")
 
 
@@ -21,6 +23,15 @@ class RetryError(Exception):
 class RetryConfig:
     """Configuration for retry behavior."""
 
+    __slots__ = (
+        "max_attempts",
+        "initial_delay",
+        "max_delay",
+        "exponential_base",
+        "retryable_exceptions",
+        "non_retryable_exceptions",
+    )
+
     def __init__(
         self,
         max_attempts: int = 3,
@@ -28,6 +39,7 @@ class RetryConfig:
         max_delay: float = 30.0,
         exponential_base: float = 2.0,
         retryable_exceptions: tuple[type[Exception], ...] = (Exception,),
+        non_retryable_exceptions: tuple[type[Exception], ...] = (ValidationError,),
     ):
         """Initialize retry configuration.
 
@@ -37,12 +49,15 @@ class RetryConfig:
             max_delay: Maximum delay between retries in seconds
             exponential_base: Base for exponential backoff
             retryable_exceptions: Tuple of exception types to retry on
+            non_retryable_exceptions: Tuple of exception types that fail immediately,
+                even when they also match ``retryable_exceptions``
         """
         self.max_attempts = max_attempts
         self.initial_delay = initial_delay
         self.max_delay = max_delay
         self.exponential_base = exponential_base
         self.retryable_exceptions = retryable_exceptions
+        self.non_retryable_exceptions = non_retryable_exceptions
 
 
 # Default configurations for different scenarios
@@ -57,6 +72,8 @@ LLM_RETRY_CONFIG = RetryConfig(
     initial_delay=2.0,
     max_delay=60.0,
     exponential_base=2.0,
+    # Deterministic failures (bad input, parsing bugs) fail the same way on every attempt
+    non_retryable_exceptions=(ValidationError, KeyError, TypeError),
 )
 
 NETWORK_RETRY_CONFIG = RetryConfig(
@@ -110,6 +127,10 @@ async def retry_async(
         try:
             return await func(*args, **kwargs)
 
+        except config.non_retryable_exceptions as e:
+            last_exception = e
+            logger.error(f"[Retry] {operation_name} failed with non-retryable error: {e}")
+            break
         except config.retryable_exceptions as e:
             last_exception = e
             remaining = config.max_attempts - attempt - 1
@@ -4,12 +4,12 @@ from src.workflows.content_pipeline import (
     ContentPipeline,
     ContentState,
     generate_content,
-    pipeline,
+    get_pipeline,
 )
 
 __all__ = [
     "ContentPipeline",
     "ContentState",
     "generate_content",
-    "pipeline",
+    "get_pipeline",
 ]
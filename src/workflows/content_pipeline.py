@@ -1,17 +1,28 @@
 """Main content generation pipeline using LangGraph with retry and error handling."""
 
+import asyncio
 import time
 import uuid
-from datetime import datetime
-from typing import Annotated, Any, TypedDict, cast
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Annotated, Any, ClassVar, TypedDict, TypeVar, cast
 
 from langchain_core.messages import BaseMessage
-from langgraph.graph import END
-from langgraph.graph.message import add_messages
+from langchain_core.runnables import RunnableConfig
+from langgraph.graph import END, START
 from langgraph.graph.state import CompiledStateGraph, StateGraph
 from loguru import logger
 
-from src.agents import EditorAgent, PlannerAgent, ResearcherAgent, WriterAgent
+from src.agents import (
+    BaseAgent,
+    EditorAgent,
+    PlannerAgent,
+    ResearcherAgent,
+    WriterAgent,
+    render_request_context,
+)
 from src.models.content import (
     ContentOutline,
     ContentRequest,
@@ -19,6 +30,7 @@ from src.models.content import (
     ContentStatus,
     ResearchResult,
 )
+from src.utils.config import settings
 from src.utils.exceptions import (
     ContentMateError,
     EditingError,
@@ -29,18 +41,150 @@ from src.utils.exceptions import (
 from src.utils.logging import PipelineLogger
 from src.utils.retry import LLM_RETRY_CONFIG, RetryError, retry_async
 
+AgentT = TypeVar("AgentT", bound=BaseAgent)
+
+# Completed responses are reused for identical requests within this window
+RESPONSE_CACHE_TTL_SECONDS = 3600.0
+RESPONSE_CACHE_MAX_ENTRIES = 256
+
+# Most recent LLM messages kept in the pipeline state
+MESSAGES_WINDOW = 20
+
+# Phase that starts once a node finishes; edit is followed only by finalize
+_NEXT_PHASE = {
+    "research": ContentStatus.PLANNING,
+    "plan": ContentStatus.WRITING,
+    "write": ContentStatus.EDITING,
+}
+
+
+def _merge_status(current: ContentStatus, new: ContentStatus) -> ContentStatus:
+    """Reducer for ``status``: take the latest value, but a failure sticks."""
+    return current if current == ContentStatus.FAILED else new
+
+
+def _latest(current: str, new: str) -> str:
+    """Reducer for ``current_phase``: take the latest value."""
+    return new
+
+
+def _windowed_messages(current: list[BaseMessage], new: list[BaseMessage]) -> list[BaseMessage]:
+    """Reducer for ``messages``: append, keeping only the last ``MESSAGES_WINDOW``."""
+    merged = current + new
+    return merged[-MESSAGES_WINDOW:] if len(merged) > MESSAGES_WINDOW else merged
+
+
+def _join_errors(current: str | None, new: str | None) -> str | None:
+    """Reducer for ``error``: keep every reported error."""
+    if current and new:
+        return f"{current}; {new}"
+    return current or new
+
+
+def request_cache_key(request: ContentRequest) -> tuple[Hashable, ...]:
+    """Build the cache key for a request from the fields that shape the output.
+
+    Case, surrounding/repeated whitespace and keyword order do not change
+    the generated content, so they are normalized away.
+
+    Args:
+        request: Content generation request
+
+    Returns:
+        Hashable key identifying equivalent requests
+    """
+    return (
+        " ".join(request.topic.split()).casefold(),
+        request.content_type,
+        request.target_audience,
+        request.tone.casefold(),
+        request.language.casefold(),
+        request.word_count,
+        tuple(sorted(keyword.casefold() for keyword in request.keywords)),
+        request.additional_instructions,
+    )
+
+
+class ResponseCache:
+    """In-process LRU cache of completed responses with a time-to-live."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = RESPONSE_CACHE_TTL_SECONDS,
+        max_entries: int = RESPONSE_CACHE_MAX_ENTRIES,
+    ):
+        """Initialize the cache.
+
+        Args:
+            ttl_seconds: How long a response stays reusable
+            max_entries: Maximum number of cached responses
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[Hashable, ...], tuple[float, ContentResponse]] = (
+            OrderedDict()
+        )
+
+    def get(self, request: ContentRequest) -> ContentResponse | None:
+        """Get the cached response for an equivalent request, if still fresh.
+
+        Args:
+            request: Content generation request
+
+        Returns:
+            Cached response or None
+        """
+        key = request_cache_key(request)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        stored_at, response = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return response
+
+    def put(self, request: ContentRequest, response: ContentResponse) -> None:
+        """Cache a response for a request.
+
+        Args:
+            request: Content generation request
+            response: Completed response for the request
+        """
+        key = request_cache_key(request)
+        # Callers may update the response they got (e.g. reassign its id), so keep a copy
+        self._entries[key] = (time.monotonic(), response.model_copy())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
 
 class ContentState(TypedDict):
-    """State object passed through the content generation pipeline."""
+    """State object passed through the content generation pipeline.
+
+    Nodes hand this state to agents as-is, without copying it first. Agents
+    must treat it as read-only and return a new dict with their updates.
+
+    It stays a TypedDict rather than a Pydantic model: agents read it through
+    ``dict.get``, and LangGraph would re-validate a model schema on every step.
+    """
 
     # Input
     request: ContentRequest
     content_id: str
+    request_context: str
 
     # Processing state
-    status: ContentStatus
-    messages: Annotated[list[BaseMessage], add_messages]
-    current_phase: str
+    # A failure status sticks and errors accumulate through their reducers.
+    # Nodes return only the messages they added, which are
+    # concatenated instead of going through an ``add_messages`` id merge per hop,
+    # and only the most recent ones are kept so the history stays bounded.
+    status: Annotated[ContentStatus, _merge_status]
+    messages: Annotated[list[BaseMessage], _windowed_messages]
+    current_phase: Annotated[str, _latest]
 
     # Agent outputs
     research: ResearchResult | None
@@ -49,12 +193,87 @@ class ContentState(TypedDict):
     content: str | None
 
     # Metadata
-    started_at: datetime
-    error: str | None
+    error: Annotated[str | None, _join_errors]
     retry_count: int
     phase_timings: dict[str, float]
 
 
+@lru_cache
+def _agent_instance(agent_cls: type[BaseAgent]) -> BaseAgent:
+    """Create the process-wide instance of an agent class."""
+    return agent_cls()
+
+
+def _shared_agent(agent_cls: type[AgentT]) -> AgentT:
+    """Get the shared instance of an agent class.
+
+    Agents hold no per-request state, so pipelines reuse one instance (and its
+    Anthropic client) per class instead of building new ones.
+
+    Args:
+        agent_cls: Agent class to instantiate
+
+    Returns:
+        Shared agent instance
+    """
+    return cast(AgentT, _agent_instance(agent_cls))
+
+
+def _pipeline_node(method_name: str) -> Callable[..., Awaitable[dict[str, Any]]]:
+    """Wrap a ContentPipeline node method so the compiled graph can be shared.
+
+    Args:
+        method_name: Name of the node method on ContentPipeline
+
+    Returns:
+        Graph node that dispatches to the pipeline passed in the run config
+    """
+
+    async def node(state: ContentState, config: RunnableConfig) -> dict[str, Any]:
+        pipeline = config["configurable"]["pipeline"]
+        return cast(dict[str, Any], await getattr(pipeline, method_name)(state))
+
+    node.__name__ = method_name.strip("_")
+    return node
+
+
+def _route_after(state: ContentState) -> str:
+    """Route to the next phase, or straight to finalize once a phase has failed."""
+    if state.get("error") or state.get("status") == ContentStatus.FAILED:
+        return "failed"
+    return "ok"
+
+
+@lru_cache
+def _compiled_graph() -> CompiledStateGraph[ContentState, None, ContentState, ContentState]:
+    """Build the LangGraph workflow.
+
+    Pipeline: Research → Plan → Write → Edit → Finalize
+
+    Returns:
+        Compiled StateGraph
+    """
+    workflow: StateGraph[ContentState, None, ContentState, ContentState] = StateGraph(ContentState)
+
+    # Add nodes for each agent
+    workflow.add_node("research", _pipeline_node("_research_node"))
+    workflow.add_node("plan", _pipeline_node("_plan_node"))
+    workflow.add_node("write", _pipeline_node("_write_node"))
+    workflow.add_node("edit", _pipeline_node("_edit_node"))
+    workflow.add_node("finalize", _pipeline_node("_finalize_node"))
+
+    # Define the edges (flow): the planner builds its outline from the research,
+    # and a failed phase goes straight to finalize
+    workflow.add_edge(START, "research")
+    workflow.add_conditional_edges("research", _route_after, {"ok": "plan", "failed": "finalize"})
+    workflow.add_conditional_edges("plan", _route_after, {"ok": "write", "failed": "finalize"})
+    workflow.add_conditional_edges("write", _route_after, {"ok": "edit", "failed": "finalize"})
+    workflow.add_edge("edit", "finalize")
+    workflow.add_edge("finalize", END)
+
+    return workflow.compile()
+
+
 class ContentPipeline:
     """LangGraph-based content generation pipeline with retry and error handling.
 
@@ -71,48 +290,34 @@ class ContentPipeline:
     - Structured logging
     """
 
+    # Immutable fields every run starts with; per-request and mutable fields
+    # are added when the initial state is built
+    _INITIAL_STATE_DEFAULTS: ClassVar[dict[str, Any]] = {
+        "status": ContentStatus.PENDING,
+        "current_phase": "init",
+        "research": None,
+        "outline": None,
+        "draft_content": None,
+        "content": None,
+        "error": None,
+        "retry_count": 0,
+    }
+
     def __init__(self) -> None:
         """Initialize the content pipeline with all agents."""
-        self.researcher = ResearcherAgent()
-        self.planner = PlannerAgent()
-        self.writer = WriterAgent()
-        self.editor = EditorAgent()
-
+        self.researcher = _shared_agent(ResearcherAgent)
+        self.planner = _shared_agent(PlannerAgent)
+        self.writer = _shared_agent(WriterAgent)
+        self.editor = _shared_agent(EditorAgent)
+        self.response_cache = ResponseCache()
+
+        # The graph shape is static, so it is compiled once per process; each
+        # instance gets a shallow copy and passes itself in through the run config.
         self.graph: CompiledStateGraph[ContentState, None, ContentState, ContentState] = (
-            self._build_graph()
+            _compiled_graph().copy()
         )
         logger.info("ContentPipeline initialized with 4 agents (retry enabled)")
 
-    def _build_graph(self) -> CompiledStateGraph[ContentState, None, ContentState, ContentState]:
-        """Build the LangGraph workflow.
-
-        Pipeline: Research → Plan → Write → Edit → Finalize
-
-        Returns:
-            Compiled StateGraph
-        """
-        workflow: StateGraph[ContentState, None, ContentState, ContentState] = StateGraph(
-            ContentState
-        )
-
-        # Add nodes for each agent
-        workflow.add_node("research", self._research_node)
-        workflow.add_node("plan", self._plan_node)
-        workflow.add_node("write", self._write_node)
-        workflow.add_node("edit", self._edit_node)
-        workflow.add_node("finalize", self._finalize_node)
-
-        # Define the edges (flow): Research → Plan → Write → Edit → Finalize
-        workflow.set_entry_point("research")
-
-        workflow.add_edge("research", "plan")
-        workflow.add_edge("plan", "write")
-        workflow.add_edge("write", "edit")
-        workflow.add_edge("edit", "finalize")
-        workflow.add_edge("finalize", END)
-
-        return workflow.compile()
-
     async def _execute_with_retry(
         self,
         agent_process: Any,
@@ -132,7 +337,7 @@ class ContentPipeline:
             Agent result dictionary
         """
         pipeline_logger = PipelineLogger(state["content_id"])
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         pipeline_logger.phase_start(phase_name)
 
@@ -141,19 +346,19 @@ class ContentPipeline:
                 dict[str, Any],
                 await retry_async(
                     agent_process,
-                    dict(state),
+                    state,
                     config=LLM_RETRY_CONFIG,
                     operation_name=f"{phase_name}_agent",
                 ),
             )
 
-            elapsed_ms = (time.time() - start_time) * 1000
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
             pipeline_logger.phase_complete(phase_name, elapsed_ms)
 
             return result
 
         except RetryError as e:
-            elapsed_ms = (time.time() - start_time) * 1000
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
             pipeline_logger.phase_error(phase_name, e)
 
             raise error_class(
@@ -165,6 +370,20 @@ class ContentPipeline:
                 },
             ) from e
 
+    @staticmethod
+    def _new_messages(state: ContentState, result: dict[str, Any]) -> list[BaseMessage]:
+        """Get the messages an agent appended to the history it was given.
+
+        Args:
+            state: Pipeline state the agent ran on
+            result: Agent result containing the full message history
+
+        Returns:
+            Messages added by the agent
+        """
+        messages: list[BaseMessage] = result.get("messages", [])
+        return messages[len(state.get("messages", [])) :]
+
     async def _research_node(self, state: ContentState) -> dict[str, Any]:
         """Execute the research agent with retry.
 
@@ -186,11 +405,11 @@ class ContentPipeline:
                 "research": result.get("research"),
                 "status": ContentStatus.RESEARCHING,
                 "current_phase": "research",
-                "messages": result.get("messages", []),
+                "messages": self._new_messages(state, result),
             }
 
         except ResearchError as e:
-            logger.error(f"[{state['content_id']}] Research failed: {e}")
+            logger.error("[{}] Research failed: {}", state["content_id"], e)
             return {
                 "error": str(e),
                 "status": ContentStatus.FAILED,
@@ -206,10 +425,6 @@ class ContentPipeline:
         Returns:
             Updated state with content outline
         """
-        # Skip if previous phase failed
-        if state.get("error"):
-            return {"status": ContentStatus.FAILED}
-
         try:
             result = await self._execute_with_retry(
                 self.planner.process,
@@ -222,11 +437,11 @@ class ContentPipeline:
                 "outline": result.get("outline"),
                 "status": ContentStatus.PLANNING,
                 "current_phase": "planning",
-                "messages": result.get("messages", []),
+                "messages": self._new_messages(state, result),
             }
 
         except PlanningError as e:
-            logger.error(f"[{state['content_id']}] Planning failed: {e}")
+            logger.error("[{}] Planning failed: {}", state["content_id"], e)
             return {
                 "error": str(e),
                 "status": ContentStatus.FAILED,
@@ -258,11 +473,11 @@ class ContentPipeline:
                 "draft_content": result.get("draft_content"),
                 "status": ContentStatus.WRITING,
                 "current_phase": "writing",
-                "messages": result.get("messages", []),
+                "messages": self._new_messages(state, result),
             }
 
         except WritingError as e:
-            logger.error(f"[{state['content_id']}] Writing failed: {e}")
+            logger.error("[{}] Writing failed: {}", state["content_id"], e)
             return {
                 "error": str(e),
                 "status": ContentStatus.FAILED,
@@ -278,10 +493,6 @@ class ContentPipeline:
         Returns:
             Updated state with edited content
         """
-        # Skip if previous phase failed
-        if state.get("error"):
-            return {"status": ContentStatus.FAILED}
-
         try:
             result = await self._execute_with_retry(
                 self.editor.process,
@@ -294,11 +505,11 @@ class ContentPipeline:
                 "content": result.get("content"),
                 "status": ContentStatus.EDITING,
                 "current_phase": "editing",
-                "messages": result.get("messages", []),
+                "messages": self._new_messages(state, result),
             }
 
         except EditingError as e:
-            logger.error(f"[{state['content_id']}] Editing failed: {e}")
+            logger.error("[{}] Editing failed: {}", state["content_id"], e)
             return {
                 "error": str(e),
                 "status": ContentStatus.FAILED,
@@ -318,7 +529,7 @@ class ContentPipeline:
 
         # Check if any error occurred
         if state.get("error"):
-            logger.warning(f"[{content_id}] Pipeline completed with errors")
+            logger.warning("[{}] Pipeline completed with errors", content_id)
             return {
                 "status": ContentStatus.FAILED,
                 "current_phase": "finalize",
@@ -326,54 +537,125 @@ class ContentPipeline:
 
         # Validate final content
         if not state.get("content"):
-            logger.warning(f"[{content_id}] Pipeline completed but no content generated")
+            logger.warning("[{}] Pipeline completed but no content generated", content_id)
             return {
                 "error": "No content was generated",
                 "status": ContentStatus.FAILED,
                 "current_phase": "finalize",
             }
 
-        logger.info(f"[{content_id}] Content generation completed successfully")
+        logger.info("[{}] Content generation completed successfully", content_id)
         return {
             "status": ContentStatus.COMPLETED,
             "current_phase": "finalize",
         }
 
-    async def generate(self, request: ContentRequest) -> ContentResponse:
+    async def generate_stream(
+        self,
+        request: ContentRequest,
+        content_id: str | None = None,
+    ) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """Run the pipeline, yielding each node's state update as it completes.
+
+        Consumers can act on early results (e.g. persist research) while later
+        phases are still running.
+
+        Args:
+            request: Content generation request
+            content_id: Optional ID for this generation (generated if omitted)
+
+        Yields:
+            ``(node_name, update)`` for every finished node, followed by
+            ``(END, final_state)`` with the fully merged state
+        """
+        content_id = content_id or uuid.uuid4().hex
+
+        logger.info("[{}] Starting content generation: {:.50}...", content_id, request.topic)
+
+        # Initialize state
+        initial_state = cast(
+            ContentState,
+            {
+                **self._INITIAL_STATE_DEFAULTS,
+                "request": request,
+                "content_id": content_id,
+                "request_context": render_request_context(request),
+                "messages": [],
+                "phase_timings": {},
+            },
+        )
+
+        final_state: dict[str, Any] = dict(initial_state)
+        async for mode, chunk in self.graph.astream(
+            initial_state,
+            config={"configurable": {"pipeline": self}},
+            stream_mode=["updates", "values"],
+        ):
+            if mode == "values":
+                final_state = cast(dict[str, Any], chunk)
+                continue
+            for node_name, update in cast(dict[str, dict[str, Any]], chunk).items():
+                yield node_name, update
+
+        yield END, final_state
+
+    async def generate(
+        self,
+        request: ContentRequest,
+        on_status: Callable[[ContentStatus], Awaitable[None]] | None = None,
+        use_cache: bool = True,
+    ) -> ContentResponse:
         """Generate content using the full pipeline.
 
         Args:
             request: Content generation request
+            on_status: Optional callback awaited with each phase as it starts,
+                e.g. to publish progress
+            use_cache: Whether an equivalent cached response may be returned;
+                a fresh result is still cached. Ignored when
+                ``settings.response_cache_enabled`` is off.
 
         Returns:
             Generated content response
         """
-        content_id = str(uuid.uuid4())
+        content_id = uuid.uuid4().hex
         started_at = datetime.utcnow()
+        # Durations come from the monotonic clock; only created_at is wall-clock
+        start_time = time.perf_counter()
 
-        logger.info(f"[{content_id}] Starting content generation: {request.topic[:50]}...")
-
-        # Initialize state
-        initial_state: ContentState = {
-            "request": request,
-            "content_id": content_id,
-            "status": ContentStatus.PENDING,
-            "messages": [],
-            "current_phase": "init",
-            "research": None,
-            "outline": None,
-            "draft_content": None,
-            "content": None,
-            "started_at": started_at,
-            "error": None,
-            "retry_count": 0,
-            "phase_timings": {},
-        }
+        cached = (
+            self.response_cache.get(request)
+            if use_cache and settings.response_cache_enabled
+            else None
+        )
+        if cached is not None:
+            logger.info("[{}] Reusing cached content from {}", content_id, cached.id)
+            return cached.model_copy(
+                update={
+                    "id": content_id,
+                    "request": request,
+                    "created_at": started_at,
+                    "completed_at": started_at,
+                    "processing_time_seconds": 0.0,
+                },
+                deep=True,
+            )
 
         try:
-            final_state = await self.graph.ainvoke(initial_state)
-            completed_at = datetime.utcnow()
-            processing_time = (completed_at - started_at).total_seconds()
+            final_state: dict[str, Any] = {}
+            if on_status is not None:
+                await on_status(ContentStatus.RESEARCHING)
+            async for node_name, update in self.generate_stream(request, content_id):
+                if node_name == END:
+                    final_state = update
+                elif (
+                    on_status is not None
+                    and node_name in _NEXT_PHASE
+                    and update.get("status") != ContentStatus.FAILED
+                ):
+                    await on_status(_NEXT_PHASE[node_name])
+            processing_time = time.perf_counter() - start_time
+            completed_at = started_at + timedelta(seconds=processing_time)
 
             # Determine final status
             final_status = final_state.get("status", ContentStatus.COMPLETED)
@@ -381,15 +663,17 @@ class ContentPipeline:
 
             if final_status == ContentStatus.COMPLETED:
                 logger.info(
-                    f"[{content_id}] Generation completed successfully in {processing_time:.2f}s"
+                    "[{}] Generation completed successfully in {:.2f}s", content_id, processing_time
                 )
             else:
                 logger.warning(
-                    f"[{content_id}] Generation failed at phase "
-                    f"'{final_state.get('current_phase', 'unknown')}': {error_message}"
+                    "[{}] Generation failed at phase '{}': {}",
+                    content_id,
+                    final_state.get("current_phase", "unknown"),
+                    error_message,
                 )
 
-            return ContentResponse(
+            response = ContentResponse(
                 id=content_id,
                 status=final_status,
                 request=request,
@@ -400,12 +684,16 @@ class ContentPipeline:
                 completed_at=completed_at,
                 processing_time_seconds=processing_time,
             )
+            if final_status == ContentStatus.COMPLETED and settings.response_cache_enabled:
+                self.response_cache.put(request, response)
+
+            return response
 
         except Exception as e:
-            completed_at = datetime.utcnow()
-            processing_time = (completed_at - started_at).total_seconds()
+            processing_time = time.perf_counter() - start_time
+            completed_at = started_at + timedelta(seconds=processing_time)
 
-            logger.error(f"[{content_id}] Pipeline crashed: {e}")
+            logger.error("[{}] Pipeline crashed: {}", content_id, e)
 
             return ContentResponse(
                 id=content_id,
@@ -416,18 +704,58 @@ class ContentPipeline:
                 processing_time_seconds=processing_time,
             )
 
+    async def generate_batch(
+        self,
+        requests: list[ContentRequest],
+        max_concurrency: int = 4,
+    ) -> list[ContentResponse]:
+        """Generate content for several requests concurrently.
+
+        Args:
+            requests: Content generation requests
+            max_concurrency: Maximum number of pipelines running at once, to
+                stay within upstream LLM rate limits
+
+        Returns:
+            Generated content responses, in the same order as ``requests``
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(request: ContentRequest) -> ContentResponse:
+            async with semaphore:
+                return await self.generate(request)
+
+        # generate() turns pipeline failures into FAILED responses, so one bad
+        # request cannot cancel the rest of the batch
+        return list(await asyncio.gather(*(run(request) for request in requests)))
+
 
-# Singleton instance
-pipeline = ContentPipeline()
+@lru_cache
+def get_pipeline() -> ContentPipeline:
+    """Get the shared pipeline instance, building it on first use.
+
+    Deferring construction keeps agent setup and graph compilation out of
+    module import.
+
+    Returns:
+        Shared content pipeline
+    """
+    return ContentPipeline()
 
 
-async def generate_content(request: ContentRequest) -> ContentResponse:
+async def generate_content(
+    request: ContentRequest,
+    on_status: Callable[[ContentStatus], Awaitable[None]] | None = None,
+    use_cache: bool = True,
+) -> ContentResponse:
     """Convenience function to generate content.
 
     Args:
         request: Content generation request
+        on_status: Optional callback awaited with each phase as it starts
+        use_cache: Whether an equivalent cached response may be returned
 
     Returns:
         Generated content response
     """
-    return await pipeline.generate(request)
+    return await get_pipeline().generate(request, on_status, use_cache)
@@ -0,0 +1,14 @@
+"""Shared fixtures for the whole test suite."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+
+@pytest.fixture
+def fake_sleep(monkeypatch):
+    """Replace asyncio.sleep so retry backoff delays are recorded instead of waited out."""
+    sleep = AsyncMock()
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+    return sleep
@@ -67,7 +67,6 @@ class TestPlannerAgent:
         assert "structure" in prompt or "outline" in prompt
         assert "json" in prompt
 
-    @pytest.mark.asyncio
     async def test_process_requires_request(self, planner):
         """Test that process raises error without request."""
         with pytest.raises(ValueError, match="No content request"):
@@ -96,6 +95,13 @@ class TestPlannerAgent:
         assert sample_request.topic in prompt
         assert "RESEARCH FINDINGS" not in prompt
 
+    def test_build_planning_prompt_uses_request_context(self, planner, sample_request):
+        """Test a pre-rendered request context replaces the shared request fields."""
+        prompt = planner._build_planning_prompt(sample_request, None, "TONE: pre-rendered")
+
+        assert "TONE: pre-rendered" in prompt
+        assert "Marketing professionals" not in prompt
+
 
 class TestOutlineParsing:
     """Test content outline parsing."""
@@ -157,6 +163,18 @@ Hope this helps!"""
         assert result.title == "Test Title"
         assert result.hook == "Test hook"
 
+    def test_parse_json_followed_by_braces(self, planner):
+        """Test the first balanced object is used when later text has braces."""
+        response = (
+            '{"title": "Use {braces} \\"wisely\\"", "hook": "Hi", "sections": []}'
+            "\n\nNote: replace {placeholders} before publishing."
+        )
+
+        result = planner._parse_outline(response)
+
+        assert result.title == 'Use {braces} "wisely"'
+        assert result.hook == "Hi"
+
     def test_parse_invalid_json_fallback(self, planner):
         """Test fallback parsing when JSON is invalid."""
         response = """
@@ -189,6 +207,16 @@ Title: My Great Article
         assert isinstance(result, ContentOutline)
         assert len(result.sections) > 0
 
+    def test_parse_empty_response_returns_independent_copies(self, planner):
+        """Test the default outline for empty input is not shared between calls."""
+        first = planner._parse_outline("   \n")
+        first.sections[0]["points"].append("Changed")
+
+        second = planner._parse_outline("")
+
+        assert second.title == "Content Outline"
+        assert "Changed" not in second.sections[0]["points"]
+
     def test_parse_malformed_json(self, planner):
         """Test parsing malformed JSON uses fallback."""
         response = '{"title": "Test", "sections": [incomplete'
@@ -207,7 +235,6 @@ class TestPlannerIntegration:
         with patch("src.agents.base.ChatAnthropic"):
             return PlannerAgent()
 
-    @pytest.mark.asyncio
     async def test_process_with_mocked_llm(self, planner, sample_request, sample_research):
         """Test full process with mocked LLM response."""
         mock_response = MagicMock()
@@ -42,7 +42,6 @@ class TestResearcherAgent:
         assert "research" in prompt
         assert "facts" in prompt or "information" in prompt
 
-    @pytest.mark.asyncio
     async def test_process_requires_request(self, researcher):
         """Test that process raises error without request."""
         with pytest.raises(ValueError, match="No content request"):
@@ -0,0 +1,37 @@
+"""Shared fixtures for API tests."""
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.main import app
+from src.api.routes.content import _last_generation_at, content_storage
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Create one test client for the whole session."""
+    # Not entered as a context manager: that would run the app lifespan, which
+    # starts the MCP servers. Without it, no startup code runs at all.
+    return TestClient(app)
+
+
+@pytest.fixture
+async def aclient():
+    """Create an async client that calls the app in the test's own event loop."""
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def _reset_content_storage():
+    """Give every test empty in-memory content storage and drop what it stored."""
+    # Cleared in place: routes and tests share this dict object, so rebinding
+    # the module attribute would leave them pointing at different dicts
+    content_storage.clear()
+    _last_generation_at.clear()
+    yield
+    content_storage.clear()
+    _last_generation_at.clear()
@@ -1,9 +1,11 @@
 """Tests for authentication routes and service."""
 
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.user import (
     Token,
@@ -13,6 +15,29 @@ from src.models.user import (
 )
 from src.services.auth_service import AuthService
 
+# Fixed timestamp so the fixture user is deterministic
+FIXED_DATETIME = datetime(2024, 1, 1)
+
+
+@dataclass(slots=True)
+class UserRecordStub:
+    """Plain stand-in for a user database row; no call recording is needed."""
+
+    id: str
+    email: str
+    full_name: str
+    hashed_password: str
+    is_active: bool
+    is_superuser: bool
+    created_at: datetime
+    updated_at: datetime
+
+
+@pytest.fixture(scope="module")
+def sample_password_hash():
+    """Hash the fixture user's password once per module, since hashing is deliberately slow."""
+    return AuthService.hash_password("password123")
+
 
 class TestAuthService:
     """Tests for AuthService."""
@@ -104,12 +129,7 @@ class TestAuthServiceAsync:
     @pytest.fixture
     def mock_session(self):
         """Create mock database session."""
-        session = AsyncMock()
-        session.add = MagicMock()
-        session.flush = AsyncMock()
-        session.refresh = AsyncMock()
-        session.execute = AsyncMock()
-        return session
+        return AsyncMock(spec_set=AsyncSession)
 
     @pytest.fixture
     def auth_service(self, mock_session):
@@ -117,20 +137,19 @@ class TestAuthServiceAsync:
         return AuthService(mock_session)
 
     @pytest.fixture
-    def sample_user_db(self):
+    def sample_user_db(self, sample_password_hash):
         """Create sample user database record."""
-        user = MagicMock()
-        user.id = "user-123"
-        user.email = "test@example.com"
-        user.full_name = "Test User"
-        user.hashed_password = AuthService.hash_password("password123")
-        user.is_active = True
-        user.is_superuser = False
-        user.created_at = datetime.utcnow()
-        user.updated_at = datetime.utcnow()
-        return user
-
-    @pytest.mark.asyncio
+        return UserRecordStub(
+            id="user-123",
+            email="test@example.com",
+            full_name="Test User",
+            hashed_password=sample_password_hash,
+            is_active=True,
+            is_superuser=False,
+            created_at=FIXED_DATETIME,
+            updated_at=FIXED_DATETIME,
+        )
+
     async def test_get_user_by_email_found(self, auth_service, mock_session, sample_user_db):
         """Test getting user by email when found."""
         mock_result = MagicMock()
@@ -142,7 +161,6 @@ class TestAuthServiceAsync:
         assert user is not None
         assert user.email == "test@example.com"
 
-    @pytest.mark.asyncio
     async def test_get_user_by_email_not_found(self, auth_service, mock_session):
         """Test getting user by email when not found."""
         mock_result = MagicMock()
@@ -153,7 +171,6 @@ class TestAuthServiceAsync:
 
         assert user is None
 
-    @pytest.mark.asyncio
     async def test_create_user(self, auth_service, mock_session):
         """Test creating a new user."""
         mock_result = MagicMock()
@@ -171,7 +188,6 @@ class TestAuthServiceAsync:
         mock_session.add.assert_called_once()
         mock_session.flush.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_create_user_email_exists(self, auth_service, mock_session, sample_user_db):
         """Test creating user with existing email."""
         mock_result = MagicMock()
@@ -187,7 +203,6 @@ class TestAuthServiceAsync:
         with pytest.raises(ValueError, match="Email already registered"):
             await auth_service.create_user(user_data)
 
-    @pytest.mark.asyncio
     async def test_authenticate_success(self, auth_service, mock_session, sample_user_db):
         """Test successful authentication."""
         mock_result = MagicMock()
@@ -199,7 +214,6 @@ class TestAuthServiceAsync:
         assert user is not None
         assert user.email == "test@example.com"
 
-    @pytest.mark.asyncio
     async def test_authenticate_wrong_password(self, auth_service, mock_session, sample_user_db):
         """Test authentication with wrong password."""
         mock_result = MagicMock()
@@ -210,7 +224,6 @@ class TestAuthServiceAsync:
 
         assert user is None
 
-    @pytest.mark.asyncio
     async def test_authenticate_user_not_found(self, auth_service, mock_session):
         """Test authentication when user not found."""
         mock_result = MagicMock()
@@ -221,7 +234,6 @@ class TestAuthServiceAsync:
 
         assert user is None
 
-    @pytest.mark.asyncio
     async def test_authenticate_inactive_user(self, auth_service, mock_session, sample_user_db):
         """Test authentication for inactive user."""
         sample_user_db.is_active = False
@@ -233,7 +245,6 @@ class TestAuthServiceAsync:
 
         assert user is None
 
-    @pytest.mark.asyncio
     async def test_create_tokens(self, auth_service, sample_user_db):
         """Test creating access and refresh tokens."""
         tokens = await auth_service.create_tokens(sample_user_db)
@@ -1,14 +1,17 @@
 """Tests for content API endpoints."""
 
+import asyncio
+import io
+import json
+import zipfile
 from datetime import datetime
-from unittest.mock import AsyncMock, patch
+from unittest.mock import DEFAULT, AsyncMock, patch
 
 import pytest
-from fastapi.testclient import TestClient
+from fastapi import BackgroundTasks, Request
 from pydantic import ValidationError
 
-from src.api.main import app
-from src.api.routes.content import content_storage
+from src.api.routes.content import content_storage, create_content_async
 from src.models.content import (
     ContentOutline,
     ContentRequest,
@@ -17,17 +20,19 @@ from src.models.content import (
     ContentType,
     ResearchResult,
 )
+from src.utils.config import settings
+from src.workflows.content_pipeline import ContentPipeline
 
+# Fixed timestamp so fixture content is deterministic
+FIXED_DATETIME = datetime(2024, 1, 1)
 
-@pytest.fixture
-def client():
-    """Create test client."""
-    # Clear storage before each test
-    content_storage.clear()
-    return TestClient(app)
+JSON_HEADERS = {"content-type": "application/json"}
 
+# Keep this module's shared fixtures on one xdist worker
+pytestmark = pytest.mark.xdist_group(name="api")
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def sample_content_request():
     """Sample content request payload."""
     return {
@@ -39,13 +44,19 @@ def sample_content_request():
     }
 
 
-@pytest.fixture
-def sample_completed_content():
-    """Sample completed content for testing."""
-    return ContentResponse(
+@pytest.fixture(scope="session")
+def sample_content_body(sample_content_request):
+    """Sample content request payload serialized once as a JSON body."""
+    return json.dumps(sample_content_request).encode()
+
+
+@pytest.fixture(scope="session")
+def _base_completed_content():
+    """Completed content built once per session from trusted data, without validation."""
+    return ContentResponse.model_construct(
         id="test-content-123",
         status=ContentStatus.COMPLETED,
-        request=ContentRequest(
+        request=ContentRequest.model_construct(
             topic="Test topic for content generation",
             content_type=ContentType.BLOG_POST,
             tone="professional",
@@ -53,25 +64,31 @@ def sample_completed_content():
             word_count=1000,
         ),
         content="# Test Content\n\nThis is the generated content.",
-        outline=ContentOutline(
+        outline=ContentOutline.model_construct(
             title="Test Content Title",
             hook="This is a hook",
             sections=[{"header": "Section 1", "purpose": "Test", "points": ["Point 1"]}],
             conclusion_points=["Conclusion"],
             cta="Call to action",
         ),
-        research=ResearchResult(
+        research=ResearchResult.model_construct(
             key_facts=["Fact 1"],
             statistics=["Stat 1"],
             quotes=["Quote 1"],
             competitor_insights=["Insight 1"],
         ),
-        created_at=datetime.utcnow(),
-        completed_at=datetime.utcnow(),
+        created_at=FIXED_DATETIME,
+        completed_at=FIXED_DATETIME,
         processing_time_seconds=5.5,
     )
 
 
+@pytest.fixture
+def sample_completed_content(_base_completed_content):
+    """Sample completed content for testing (a fresh copy per test)."""
+    return _base_completed_content.model_copy(deep=True)
+
+
 class TestHealthEndpoints:
     """Test health and root endpoints."""
 
@@ -103,31 +120,30 @@ class TestContentEndpoints:
         assert isinstance(response.json(), list)
         assert len(response.json()) == 0
 
-    def test_get_nonexistent_content(self, client):
-        """Test getting non-existent content returns 404."""
-        response = client.get("/api/v1/content/nonexistent-id")
+    @pytest.mark.parametrize(
+        ("method", "path"),
+        [
+            ("GET", "/api/v1/content/nonexistent-id"),
+            ("DELETE", "/api/v1/content/nonexistent-id"),
+            ("GET", "/api/v1/content/nonexistent-id/status"),
+            ("GET", "/api/v1/content/nonexistent-id/export"),
+            ("GET", "/api/v1/content/nonexistent-id/export/bundle"),
+            ("GET", "/api/v1/content/nonexistent-id/stream"),
+        ],
+    )
+    def test_nonexistent_content_returns_404(self, client, method, path):
+        """Test every per-content endpoint returns 404 for an unknown ID."""
+        response = client.request(method, path)
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
 
-    def test_delete_nonexistent_content(self, client):
-        """Test deleting non-existent content returns 404."""
-        response = client.delete("/api/v1/content/nonexistent-id")
-        assert response.status_code == 404
-
-    def test_get_status_nonexistent_content(self, client):
-        """Test getting status of non-existent content returns 404."""
-        response = client.get("/api/v1/content/nonexistent-id/status")
-        assert response.status_code == 404
-
-    @patch("src.api.routes.content.generate_content", new_callable=AsyncMock)
-    def test_create_content_validation_topic_too_short(self, mock_generate, client):
+    def test_create_content_validation_topic_too_short(self, client):
         """Test content creation validates topic length."""
         invalid_request = {"topic": "hi", "content_type": "blog_post"}
         response = client.post("/api/v1/content/generate", json=invalid_request)
         assert response.status_code == 422  # Validation error
 
-    @patch("src.api.routes.content.generate_content", new_callable=AsyncMock)
-    def test_create_content_validation_word_count_too_low(self, mock_generate, client):
+    def test_create_content_validation_word_count_too_low(self, client):
         """Test content creation validates word count."""
         invalid_request = {
             "topic": "Valid topic for testing",
@@ -141,14 +157,15 @@ class TestContentEndpoints:
         self,
         mock_generate,
         client,
-        sample_content_request,
+        sample_content_body,
         sample_completed_content,
     ):
         """Test async content generation returns content_id."""
         mock_generate.return_value = sample_completed_content
         response = client.post(
             "/api/v1/content/generate/async",
-            json=sample_content_request,
+            content=sample_content_body,
+            headers=JSON_HEADERS,
         )
         assert response.status_code == 200
         data = response.json()
@@ -163,30 +180,91 @@ class TestContentEndpoints:
             ContentStatus.COMPLETED,
             ContentStatus.FAILED,
         }
+        # Async jobs skip the response cache unless asked to use it
+        assert mock_generate.call_args.kwargs["use_cache"] is False
+
+    @pytest.mark.parametrize(
+        ("trusted_proxy_hosts", "client_ids", "second_status"),
+        [
+            ([], (None, None), 429),  # Same host, no client ID
+            (["testclient"], ("user-a", "user-a"), 429),
+            (["testclient"], ("user-a", "user-b"), 200),  # Two users behind one proxy
+            ([], ("user-a", "user-b"), 429),  # Untrusted callers cannot pick their key
+        ],
+    )
+    @patch("src.api.routes.content.generate_content", new_callable=AsyncMock)
+    def test_repeated_generation_is_throttled(
+        self,
+        mock_generate,
+        client,
+        monkeypatch,
+        sample_content_body,
+        sample_completed_content,
+        trusted_proxy_hosts,
+        client_ids,
+        second_status,
+    ):
+        """Test a client's second submit right after its first is rejected with 429."""
+        monkeypatch.setattr(settings, "trusted_proxy_hosts", trusted_proxy_hosts)
+        mock_generate.return_value = sample_completed_content
+
+        first, second = (
+            client.post(
+                "/api/v1/content/generate/async",
+                content=sample_content_body,
+                headers=JSON_HEADERS | ({"X-Client-ID": client_id} if client_id else {}),
+            )
+            for client_id in client_ids
+        )
+        assert first.status_code == 200
+        assert second.status_code == second_status
+        if second_status == 429:
+            assert "retry-after" in second.headers
 
     @patch("src.api.routes.content.generate_content", new_callable=AsyncMock)
     async def test_sync_content_generation_success(
-        self, mock_generate, client, sample_content_request, sample_completed_content
+        self, mock_generate, aclient, sample_content_body, sample_completed_content
     ):
         """Test synchronous content generation."""
         mock_generate.return_value = sample_completed_content
 
-        response = client.post(
+        response = await aclient.post(
             "/api/v1/content/generate",
-            json=sample_content_request,
+            content=sample_content_body,
+            headers=JSON_HEADERS,
         )
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "completed"
         assert data["content"] is not None
+        assert mock_generate.call_args.kwargs["use_cache"] is True
+
+    @patch("src.api.routes.content.generate_content", new_callable=AsyncMock)
+    async def test_sync_generation_force_refresh_skips_cache(
+        self, mock_generate, aclient, sample_content_body, sample_completed_content
+    ):
+        """Test force_refresh asks the pipeline not to reuse a cached response."""
+        mock_generate.return_value = sample_completed_content
+
+        response = await aclient.post(
+            "/api/v1/content/generate",
+            params={"force_refresh": "true"},
+            content=sample_content_body,
+            headers=JSON_HEADERS,
+        )
+
+        assert response.status_code == 200
+        assert mock_generate.call_args.kwargs["use_cache"] is False
 
     def test_list_content_pagination(self, client, sample_completed_content):
         """Test content listing with pagination."""
         # Add multiple content items
-        for i in range(5):
-            content = sample_completed_content.model_copy()
-            content.id = f"test-{i}"
-            content_storage[content.id] = content
+        content_storage.update(
+            {
+                f"test-{i}": sample_completed_content.model_copy(update={"id": f"test-{i}"})
+                for i in range(5)
+            }
+        )
 
         # Test limit
         response = client.get("/api/v1/content?limit=2")
@@ -198,6 +276,19 @@ class TestContentEndpoints:
         assert response.status_code == 200
         assert len(response.json()) == 2
 
+    def test_list_content_returns_previews(self, client, sample_completed_content):
+        """Test listing entries carry a truncated preview instead of the full body."""
+        long_body = "word " * 200  # 1,000 characters
+        content_storage[sample_completed_content.id] = sample_completed_content.model_copy(
+            update={"content": long_body}
+        )
+
+        (item,) = client.get("/api/v1/content").json()
+        assert "content" not in item
+        assert "outline" not in item
+        assert item["content_preview"] == long_body[:500] + "..."
+        assert item["word_count"] == 200
+
     def test_get_content_success(self, client, sample_completed_content):
         """Test getting content by ID."""
         content_storage[sample_completed_content.id] = sample_completed_content
@@ -219,6 +310,95 @@ class TestContentEndpoints:
         assert data["status"] == "completed"
         assert "processing_time_seconds" in data
 
+    def test_stream_finished_content(self, client, sample_completed_content):
+        """Test the status stream sends one event for finished content, then closes."""
+        content_storage[sample_completed_content.id] = sample_completed_content
+
+        response = client.get(f"/api/v1/content/{sample_completed_content.id}/stream")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+
+        events = [line for line in response.text.splitlines() if line.startswith("data:")]
+        assert len(events) == 1
+        data = json.loads(events[0].removeprefix("data:"))
+        assert data["id"] == sample_completed_content.id
+        assert data["status"] == "completed"
+
+    async def test_stream_async_generation_ends_with_content(
+        self, aclient, sample_content_request, _base_completed_content
+    ):
+        """Test a streamed async job's final event carries the generated content."""
+        with patch.multiple(
+            "src.workflows.content_pipeline",
+            ResearcherAgent=DEFAULT,
+            PlannerAgent=DEFAULT,
+            WriterAgent=DEFAULT,
+            EditorAgent=DEFAULT,
+        ):
+            pipeline = ContentPipeline()
+        pipeline.researcher.process = AsyncMock(
+            side_effect=lambda state: {**state, "research": _base_completed_content.research}
+        )
+        pipeline.planner.process = AsyncMock(
+            side_effect=lambda state: {**state, "outline": _base_completed_content.outline}
+        )
+        pipeline.writer.process = AsyncMock(
+            side_effect=lambda state: {**state, "draft_content": "Draft"}
+        )
+        pipeline.editor.process = AsyncMock(
+            side_effect=lambda state: {**state, "content": "Final content"}
+        )
+
+        # Called directly rather than through the client, so the job can run
+        # while the stream is open instead of before it
+        background_tasks = BackgroundTasks()
+        with patch("src.api.routes.content.generate_content", new=pipeline.generate):
+            started = await create_content_async(
+                ContentRequest(**sample_content_request),
+                Request({"type": "http", "headers": [], "client": ("testclient", 50000)}),
+                background_tasks,
+            )
+            job = asyncio.create_task(background_tasks())
+            async with aclient.stream(
+                "GET", f"/api/v1/content/{started['content_id']}/stream"
+            ) as response:
+                events = [
+                    json.loads(line.removeprefix("data:"))
+                    async for line in response.aiter_lines()
+                    if line.startswith("data:")
+                ]
+            await job
+
+        assert events[-1]["status"] == "completed"
+        assert events[-1]["content"] == "Final content"
+        # No earlier event may already claim the job is finished
+        assert all(event["status"] != "completed" for event in events[:-1])
+        # Phases are reported in pipeline order
+        order = [status.value for status in ContentStatus]
+        positions = [order.index(event["status"]) for event in events]
+        assert positions == sorted(positions)
+
+    async def test_async_status_never_moves_backwards(self, sample_content_request):
+        """Test a stale phase update does not overwrite a later stored phase."""
+        stored = []
+
+        async def fake_generate(request, on_status, use_cache):
+            await on_status(ContentStatus.WRITING)
+            await on_status(ContentStatus.PLANNING)
+            stored.append(content_storage[started["content_id"]].status)
+            raise RuntimeError("stop")
+
+        background_tasks = BackgroundTasks()
+        with patch("src.api.routes.content.generate_content", new=fake_generate):
+            started = await create_content_async(
+                ContentRequest(**sample_content_request),
+                Request({"type": "http", "headers": [], "client": ("testclient", 50000)}),
+                background_tasks,
+            )
+            await background_tasks()
+
+        assert stored == [ContentStatus.WRITING]
+
     def test_delete_content_success(self, client, sample_completed_content):
         """Test deleting content."""
         content_storage[sample_completed_content.id] = sample_completed_content
@@ -231,11 +411,6 @@ class TestContentEndpoints:
 class TestExportEndpoints:
     """Test content export endpoints."""
 
-    def test_export_nonexistent_content(self, client):
-        """Test exporting non-existent content returns 404."""
-        response = client.get("/api/v1/content/nonexistent-id/export")
-        assert response.status_code == 404
-
     def test_export_incomplete_content(self, client, sample_completed_content):
         """Test exporting incomplete content returns 400."""
         # Set status to pending
@@ -247,56 +422,61 @@ class TestExportEndpoints:
         assert response.status_code == 400
         assert "not ready" in response.json()["detail"].lower()
 
-    def test_export_markdown(self, client, sample_completed_content):
-        """Test exporting content as Markdown."""
+    @pytest.mark.parametrize(
+        ("export_format", "media_type", "extension", "expected_snippets"),
+        [
+            ("markdown", "text/markdown", ".md", ("---", "Test Content")),  # YAML frontmatter
+            ("html", "text/html", ".html", ("<!DOCTYPE html>", "<title>")),
+            ("json", "application/json", ".json", ('"id"',)),
+            ("txt", "text/plain", ".txt", ("Test Content",)),
+        ],
+    )
+    def test_export_format(
+        self,
+        client,
+        sample_completed_content,
+        export_format,
+        media_type,
+        extension,
+        expected_snippets,
+    ):
+        """Test exporting content in each download format."""
         content_storage[sample_completed_content.id] = sample_completed_content
 
         response = client.get(
-            f"/api/v1/content/{sample_completed_content.id}/export?format=markdown"
+            f"/api/v1/content/{sample_completed_content.id}/export?format={export_format}"
         )
         assert response.status_code == 200
-        assert response.headers["content-type"].split(";")[0] == "text/markdown"
+        assert response.headers["content-type"].split(";")[0] == media_type
         assert "attachment" in response.headers["content-disposition"]
-        assert ".md" in response.headers["content-disposition"]
-
-        content = response.content.decode("utf-8")
-        assert "---" in content  # YAML frontmatter
-        assert "Test Content" in content
-
-    def test_export_html(self, client, sample_completed_content):
-        """Test exporting content as HTML."""
-        content_storage[sample_completed_content.id] = sample_completed_content
-
-        response = client.get(f"/api/v1/content/{sample_completed_content.id}/export?format=html")
-        assert response.status_code == 200
-        assert response.headers["content-type"].split(";")[0] == "text/html"
-        assert ".html" in response.headers["content-disposition"]
+        assert extension in response.headers["content-disposition"]
 
         content = response.content.decode("utf-8")
-        assert "<!DOCTYPE html>" in content
-        assert "<title>" in content
+        for snippet in expected_snippets:
+            assert snippet in content
 
-    def test_export_json(self, client, sample_completed_content):
-        """Test exporting content as JSON."""
+    def test_export_json_body(self, client, sample_completed_content):
+        """Test the JSON export carries the content record."""
         content_storage[sample_completed_content.id] = sample_completed_content
 
         response = client.get(f"/api/v1/content/{sample_completed_content.id}/export?format=json")
-        assert response.status_code == 200
-        assert response.headers["content-type"].split(";")[0] == "application/json"
-
-        import json
 
         data = json.loads(response.content)
         assert data["id"] == sample_completed_content.id
         assert data["content"] is not None
 
-    def test_export_txt(self, client, sample_completed_content):
-        """Test exporting content as plain text."""
+    def test_export_bundle(self, client, sample_completed_content):
+        """Test the bundle endpoint returns every format in one ZIP."""
         content_storage[sample_completed_content.id] = sample_completed_content
 
-        response = client.get(f"/api/v1/content/{sample_completed_content.id}/export?format=txt")
+        response = client.get(f"/api/v1/content/{sample_completed_content.id}/export/bundle")
         assert response.status_code == 200
-        assert response.headers["content-type"].split(";")[0] == "text/plain"
+        assert response.headers["content-type"] == "application/zip"
+        assert ".zip" in response.headers["content-disposition"]
+
+        with zipfile.ZipFile(io.BytesIO(response.content)) as bundle:
+            assert len(bundle.namelist()) == 5
+            assert "Test Content" in bundle.read("content.md").decode("utf-8")
 
     def test_get_export_formats(self, client):
         """Test getting available export formats."""
@@ -324,20 +504,18 @@ class TestContentModels:
         assert request.language == "en"
         assert request.word_count == 1500
 
-    def test_content_request_validation_topic_min_length(self):
-        """Test ContentRequest validates minimum topic length."""
-        with pytest.raises(ValidationError):
-            ContentRequest(topic="hi")  # Too short
-
-    def test_content_request_validation_word_count_min(self):
-        """Test ContentRequest validates minimum word count."""
-        with pytest.raises(ValidationError):
-            ContentRequest(topic="Valid topic", word_count=50)  # Too few words
-
-    def test_content_request_validation_word_count_max(self):
-        """Test ContentRequest validates maximum word count."""
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"topic": "hi"},  # Topic too short
+            {"topic": "Valid topic", "word_count": 50},  # Too few words
+            {"topic": "Valid topic", "word_count": 15000},  # Too many words
+        ],
+    )
+    def test_content_request_validation(self, kwargs):
+        """Test ContentRequest rejects out-of-range topic length and word count."""
         with pytest.raises(ValidationError):
-            ContentRequest(topic="Valid topic", word_count=15000)  # Too many words
+            ContentRequest(**kwargs)
 
     def test_content_request_with_keywords(self):
         """Test ContentRequest with keywords."""
@@ -360,13 +538,14 @@ class TestAPIErrorHandling:
     """Test API error handling."""
 
     @patch("src.api.routes.content.generate_content")
-    def test_generation_error_handling(self, mock_generate, client, sample_content_request):
+    def test_generation_error_handling(self, mock_generate, client, sample_content_body):
         """Test that generation errors are handled properly."""
         mock_generate.side_effect = Exception("LLM API Error")
 
         response = client.post(
             "/api/v1/content/generate",
-            json=sample_content_request,
+            content=sample_content_body,
+            headers=JSON_HEADERS,
         )
         assert response.status_code == 500
         assert "error" in response.json()["detail"].lower()
@@ -7,49 +7,60 @@ import pytest
 
 from src.db.cache import ContentCache, RateLimiter
 
+# Payloads and their cached JSON, serialized once for the module
+CONTENT_DATA = {"id": "test-123", "content": "Test content"}
+CONTENT_JSON = json.dumps(CONTENT_DATA)
+PROGRESS_DATA = {"phase": "writing", "progress": 50, "message": "Writing..."}
+PROGRESS_JSON = json.dumps(PROGRESS_DATA)
 
-@pytest.fixture
+# Keep this module's shared fixtures on one xdist worker
+pytestmark = pytest.mark.xdist_group(name="db_cache")
+
+
+@pytest.fixture(scope="module")
 def mock_redis():
-    """Create a mock Redis client."""
+    """Create a mock Redis client shared by the module's tests."""
+    # Commands are awaited, which AsyncMock's automatic children already support;
+    # only scan_iter is consumed with ``async for`` and needs a plain mock
     redis = AsyncMock()
-    redis.get = AsyncMock()
-    redis.set = AsyncMock()
-    redis.delete = AsyncMock()
-    redis.incr = AsyncMock()
     redis.scan_iter = MagicMock()
     return redis
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def content_cache(mock_redis):
     """Create content cache with mock Redis."""
     return ContentCache(mock_redis)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def rate_limiter(mock_redis):
     """Create rate limiter with mock Redis."""
     return RateLimiter(mock_redis)
 
 
+@pytest.fixture(autouse=True)
+def _reset_mock_redis(mock_redis):
+    """Clear calls and configured results left on the shared client by a test."""
+    yield
+    mock_redis.reset_mock(return_value=True, side_effect=True)
+
+
 class TestContentCache:
     """Tests for ContentCache."""
 
-    @pytest.mark.asyncio
     async def test_get_content_found(self, content_cache, mock_redis):
         """Test getting cached content when found."""
         # Setup
-        content_data = {"id": "test-123", "content": "Test content"}
-        mock_redis.get.return_value = json.dumps(content_data)
+        mock_redis.get.return_value = CONTENT_JSON
 
         # Act
         result = await content_cache.get_content("test-123")
 
         # Assert
-        assert result == content_data
+        assert result == CONTENT_DATA
         mock_redis.get.assert_called_once_with("content:test-123")
 
-    @pytest.mark.asyncio
     async def test_get_content_not_found(self, content_cache, mock_redis):
         """Test getting cached content when not found."""
         # Setup
@@ -61,7 +72,6 @@ class TestContentCache:
         # Assert
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_set_content(self, content_cache, mock_redis):
         """Test caching content data."""
         # Setup
@@ -76,7 +86,6 @@ class TestContentCache:
         assert call_args[0][0] == "content:test-123"
         assert json.loads(call_args[0][1])["id"] == "test-123"
 
-    @pytest.mark.asyncio
     async def test_set_content_with_custom_ttl(self, content_cache, mock_redis):
         """Test caching content with custom TTL."""
         # Setup
@@ -90,7 +99,6 @@ class TestContentCache:
         call_kwargs = mock_redis.set.call_args[1]
         assert call_kwargs["ex"] == 7200
 
-    @pytest.mark.asyncio
     async def test_delete_content(self, content_cache, mock_redis):
         """Test deleting cached content."""
         # Act
@@ -99,7 +107,6 @@ class TestContentCache:
         # Assert
         mock_redis.delete.assert_called_once_with("content:test-123")
 
-    @pytest.mark.asyncio
     async def test_get_status(self, content_cache, mock_redis):
         """Test getting cached status."""
         # Setup
@@ -112,7 +119,6 @@ class TestContentCache:
         assert result == "completed"
         mock_redis.get.assert_called_once_with("status:test-123")
 
-    @pytest.mark.asyncio
     async def test_set_status(self, content_cache, mock_redis):
         """Test caching status."""
         # Act
@@ -124,21 +130,18 @@ class TestContentCache:
         assert call_args[0][0] == "status:test-123"
         assert call_args[0][1] == "processing"
 
-    @pytest.mark.asyncio
     async def test_get_progress(self, content_cache, mock_redis):
         """Test getting progress data."""
         # Setup
-        progress_data = {"phase": "writing", "progress": 50, "message": "Writing..."}
-        mock_redis.get.return_value = json.dumps(progress_data)
+        mock_redis.get.return_value = PROGRESS_JSON
 
         # Act
         result = await content_cache.get_progress("test-123")
 
         # Assert
-        assert result == progress_data
+        assert result == PROGRESS_DATA
         mock_redis.get.assert_called_once_with("progress:test-123")
 
-    @pytest.mark.asyncio
     async def test_set_progress(self, content_cache, mock_redis):
         """Test updating progress."""
         # Act
@@ -152,7 +155,6 @@ class TestContentCache:
         assert data["phase"] == "writing"
         assert data["progress"] == 50.0
 
-    @pytest.mark.asyncio
     async def test_delete_progress(self, content_cache, mock_redis):
         """Test deleting progress data."""
         # Act
@@ -165,7 +167,6 @@ class TestContentCache:
 class TestRateLimiter:
     """Tests for RateLimiter."""
 
-    @pytest.mark.asyncio
     async def test_is_allowed_first_request(self, rate_limiter, mock_redis):
         """Test first request is allowed."""
         # Setup
@@ -183,7 +184,6 @@ class TestRateLimiter:
         assert remaining == 9
         mock_redis.set.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_is_allowed_under_limit(self, rate_limiter, mock_redis):
         """Test request under limit is allowed."""
         # Setup
@@ -201,7 +201,6 @@ class TestRateLimiter:
         assert remaining == 4
         mock_redis.incr.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_is_allowed_at_limit(self, rate_limiter, mock_redis):
         """Test request at limit is not allowed."""
         # Setup
@@ -219,7 +218,6 @@ class TestRateLimiter:
         assert remaining == 0
         mock_redis.incr.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_get_remaining_no_requests(self, rate_limiter, mock_redis):
         """Test getting remaining when no requests made."""
         # Setup
@@ -231,7 +229,6 @@ class TestRateLimiter:
         # Assert
         assert remaining == 10
 
-    @pytest.mark.asyncio
     async def test_get_remaining_some_requests(self, rate_limiter, mock_redis):
         """Test getting remaining after some requests."""
         # Setup
@@ -243,7 +240,6 @@ class TestRateLimiter:
         # Assert
         assert remaining == 7
 
-    @pytest.mark.asyncio
     async def test_reset(self, rate_limiter, mock_redis):
         """Test resetting rate limit."""
         # Act
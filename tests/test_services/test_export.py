@@ -1,6 +1,8 @@
 """Tests for export service."""
 
+import io
 import json
+import zipfile
 from datetime import datetime
 
 import pytest
@@ -281,6 +283,29 @@ class TestPDFExport:
         assert "size: A4" in html
 
 
+class TestBundleExport:
+    """Test the all-formats ZIP bundle."""
+
+    def test_bundle_contains_every_format(self, sample_content):
+        """Test the bundle holds one entry per format, matching the single exports."""
+        with zipfile.ZipFile(io.BytesIO(ExportService.export_bundle(sample_content))) as bundle:
+            assert sorted(bundle.namelist()) == [
+                "content-print.html",
+                "content.html",
+                "content.json",
+                "content.md",
+                "content.txt",
+            ]
+            for format, entry in ExportService.BUNDLE_ENTRIES.items():
+                assert bundle.read(entry) == ExportService.export(sample_content, format)
+
+    def test_bundle_filename(self, sample_content):
+        """Test the bundle filename uses the topic slug."""
+        filename = ExportService.get_bundle_filename(sample_content)
+
+        assert filename == "ai-in-content-marketing-a-complete-guide.zip"
+
+
 class TestFilenameGeneration:
     """Test filename generation."""
 
@@ -0,0 +1,79 @@
+"""Tests for custom exceptions."""
+
+import pickle
+
+from src.utils.exceptions import (
+    AgentError,
+    ContentMateError,
+    PipelineError,
+    ResearchError,
+    WritingError,
+)
+
+
+class TestContentMateError:
+    """Test the base exception."""
+
+    def test_str_without_details(self):
+        """Test message is returned as-is without details."""
+        error = ContentMateError("Something failed")
+        assert str(error) == "Something failed"
+        assert error.details == {}
+
+    def test_str_with_details(self):
+        """Test details are appended to the message."""
+        error = ContentMateError("Something failed", details={"content_id": "abc"})
+        assert str(error) == "Something failed | Details: {'content_id': 'abc'}"
+
+    def test_str_reflects_later_changes(self):
+        """Test details added after construction show up in the text."""
+        error = ContentMateError("Something failed")
+        error.details["attempt"] = 2
+        assert str(error) == "Something failed | Details: {'attempt': 2}"
+
+    def test_subclass_keeps_base_formatting(self):
+        """Test non-agent subclasses use the base formatting."""
+        error = PipelineError("Crashed", content_id="abc", details={"phase": "write"})
+        assert str(error) == "Crashed | Details: {'phase': 'write'}"
+        assert error.content_id == "abc"
+
+    def test_pickle_round_trip(self):
+        """Test subclass attributes survive pickling."""
+        error = PipelineError("Crashed", content_id="abc", details={"phase": "write"})
+        restored = pickle.loads(pickle.dumps(error))
+
+        assert type(restored) is PipelineError
+        assert restored.content_id == "abc"
+        assert str(restored) == str(error)
+
+
+class TestAgentError:
+    """Test agent exceptions."""
+
+    def test_str_with_phase(self):
+        """Test agent and phase prefix the message."""
+        error = AgentError("Timed out", agent_name="Writer", phase="writing")
+        assert str(error) == "[Writer:writing] Timed out"
+
+    def test_str_without_phase(self):
+        """Test only the agent prefixes the message when no phase is set."""
+        error = AgentError("Timed out", agent_name="Writer")
+        assert str(error) == "[Writer] Timed out"
+
+    def test_phase_errors(self):
+        """Test phase-specific errors carry their agent and phase."""
+        error = ResearchError("No results", details={"content_id": "abc"})
+
+        assert isinstance(error, AgentError)
+        assert error.agent_name == "Researcher"
+        assert error.phase == "research"
+        assert error.details == {"content_id": "abc"}
+        assert str(error) == "[Researcher:research] No results"
+        assert str(WritingError("Empty draft")) == "[Writer:writing] Empty draft"
+
+    def test_phase_error_pickle_round_trip(self):
+        """Test phase errors unpickle to the same public class."""
+        restored = pickle.loads(pickle.dumps(ResearchError("No results")))
+
+        assert type(restored) is ResearchError
+        assert str(restored) == "[Researcher:research] No results"
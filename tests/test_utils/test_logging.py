@@ -0,0 +1,89 @@
+"""Tests for logging configuration."""
+
+import io
+import threading
+
+import orjson
+from loguru import logger
+
+from src.utils.logging import BackgroundStreamWriter, _serialize_record
+
+
+class BlockingStream(io.StringIO):
+    """StringIO whose first write waits until the test releases it."""
+
+    def __init__(self):
+        super().__init__()
+        self.writing = threading.Event()
+        self.release = threading.Event()
+
+    def write(self, text):
+        self.writing.set()
+        self.release.wait(timeout=5)
+        return super().write(text)
+
+
+class TestBackgroundStreamWriter:
+    """Test the background log writer sink."""
+
+    def test_stop_flushes_pending_records(self):
+        """Test records still buffered when stopping are written."""
+        stream = io.StringIO()
+        writer = BackgroundStreamWriter(stream)
+
+        for i in range(100):
+            writer.write(f"{i}\n")
+        writer.stop()
+
+        assert stream.getvalue().splitlines() == [str(i) for i in range(100)]
+
+    def test_full_buffer_reports_dropped_records(self):
+        """Test records dropped from a full buffer are replaced by a warning."""
+        stream = BlockingStream()
+        writer = BackgroundStreamWriter(stream, max_buffered=2)
+
+        writer.write("a\n")
+        # The writer thread is now busy with "a", so the rest queue up
+        assert stream.writing.wait(timeout=5)
+        for line in ("b\n", "c\n", "d\n"):
+            writer.write(line)
+        stream.release.set()
+        writer.stop()
+
+        lines = stream.getvalue().splitlines()
+        assert lines[0] == "a"
+        assert "WARNING" in lines[1]
+        assert "dropped 1 records" in lines[1]
+        assert lines[2:] == ["c", "d"]
+
+    def test_dropped_notice_is_json_for_serialized_records(self):
+        """Test the dropped-records warning matches JSON output."""
+        writer = BackgroundStreamWriter(io.StringIO(), serializer=str)
+        writer.stop()
+
+        notice = orjson.loads(writer._dropped_notice(3))
+
+        assert notice["level"] == "WARNING"
+        assert notice["message"] == "Log buffer full: dropped 3 records"
+
+
+class TestSerializeRecord:
+    """Test the JSON log record serializer."""
+
+    def test_extras_are_nested(self):
+        """Test bound extras cannot clash with base fields."""
+        lines = []
+        handler_id = logger.add(
+            lambda message: lines.append(_serialize_record(message)), format="{message}"
+        )
+        try:
+            logger.bind(content_id="abc", level="custom", message="bound").info("Hello")
+        finally:
+            logger.remove(handler_id)
+
+        raw = lines[0]
+        assert raw.count('"level"') == 2  # The base field and the nested extra
+        record = orjson.loads(raw)
+        assert record["level"] == "INFO"
+        assert record["message"] == "Hello"
+        assert record["extra"] == {"content_id": "abc", "level": "custom", "message": "bound"}
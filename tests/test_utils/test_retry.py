@@ -2,6 +2,7 @@
 
 import pytest
 
+from src.utils.exceptions import ValidationError
 from src.utils.retry import (
     LLM_RETRY_CONFIG,
     RetryConfig,
@@ -11,6 +12,9 @@ from src.utils.retry import (
     with_retry,
 )
 
+# Backoff delays are recorded by the shared fake_sleep fixture, never waited out
+pytestmark = pytest.mark.usefixtures("fake_sleep")
+
 
 class TestCalculateDelay:
     """Test delay calculation."""
@@ -74,7 +78,6 @@ class TestRetryConfig:
 class TestRetryAsync:
     """Test retry_async function."""
 
-    @pytest.mark.asyncio
     async def test_success_on_first_try(self):
         """Test successful execution on first try."""
 
@@ -84,7 +87,6 @@ class TestRetryAsync:
         result = await retry_async(success_func)
         assert result == "success"
 
-    @pytest.mark.asyncio
     async def test_success_after_retry(self):
         """Test success after initial failures."""
         call_count = 0
@@ -102,22 +104,20 @@ class TestRetryAsync:
         assert result == "success"
         assert call_count == 3
 
-    @pytest.mark.asyncio
-    async def test_failure_after_max_attempts(self):
+    async def test_failure_after_max_attempts(self, fake_sleep):
         """Test failure after exhausting all attempts."""
 
         async def always_fail():
             raise ValueError("Always fails")
 
-        config = RetryConfig(max_attempts=3, initial_delay=0.01)
-
         with pytest.raises(RetryError) as exc_info:
-            await retry_async(always_fail, config=config, operation_name="test_op")
+            await retry_async(always_fail, config=LLM_RETRY_CONFIG, operation_name="test_op")
 
         assert "test_op failed after 3 attempts" in str(exc_info.value)
         assert exc_info.value.last_exception is not None
+        # Production backoff between the three attempts, without waiting for it
+        assert [call.args[0] for call in fake_sleep.await_args_list] == [2.0, 4.0]
 
-    @pytest.mark.asyncio
     async def test_non_retryable_exception(self):
         """Test non-retryable exceptions are not retried."""
         call_count = 0
@@ -140,7 +140,23 @@ class TestRetryAsync:
         # but since we specified only ValueError, it will fail immediately
         # Actually, since we pass retryable_exceptions, it will retry on those only
 
-    @pytest.mark.asyncio
+    async def test_non_retryable_overrides_retryable(self):
+        """Test non-retryable exceptions fail fast even if they match retryable ones."""
+        call_count = 0
+
+        async def raise_validation_error():
+            nonlocal call_count
+            call_count += 1
+            raise ValidationError("Bad input", field="topic")
+
+        config = RetryConfig(max_attempts=3, initial_delay=0.01)
+
+        with pytest.raises(RetryError) as exc_info:
+            await retry_async(raise_validation_error, config=config)
+
+        assert call_count == 1
+        assert isinstance(exc_info.value.last_exception, ValidationError)
+
     async def test_with_arguments(self):
         """Test retry with function arguments."""
 
@@ -150,7 +166,6 @@ class TestRetryAsync:
         result = await retry_async(add, 2, 3)
         assert result == 5
 
-    @pytest.mark.asyncio
     async def test_with_kwargs(self):
         """Test retry with keyword arguments."""
 
@@ -164,7 +179,6 @@ class TestRetryAsync:
 class TestWithRetryDecorator:
     """Test with_retry decorator."""
 
-    @pytest.mark.asyncio
     async def test_decorator_success(self):
         """Test decorator on successful function."""
 
@@ -175,7 +189,6 @@ class TestWithRetryDecorator:
         result = await success_func()
         assert result == "decorated success"
 
-    @pytest.mark.asyncio
     async def test_decorator_with_config(self):
         """Test decorator with custom config."""
         call_count = 0
@@ -192,7 +205,6 @@ class TestWithRetryDecorator:
         assert result == "success"
         assert call_count == 2
 
-    @pytest.mark.asyncio
     async def test_decorator_preserves_function_name(self):
         """Test decorator preserves function metadata."""
 
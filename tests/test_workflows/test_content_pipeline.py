@@ -1,9 +1,10 @@
 """Tests for the content generation pipeline."""
 
-from datetime import datetime
-from unittest.mock import AsyncMock, patch
+import asyncio
+from unittest.mock import DEFAULT, AsyncMock, MagicMock, patch
 
 import pytest
+from langchain_core.messages import AIMessage
 
 from src.models.content import (
     ContentOutline,
@@ -12,13 +13,49 @@ from src.models.content import (
     ContentType,
     ResearchResult,
 )
-from src.workflows.content_pipeline import ContentPipeline, ContentState
+from src.utils.config import settings
+from src.workflows.content_pipeline import (
+    MESSAGES_WINDOW,
+    ContentPipeline,
+    ContentState,
+    ResponseCache,
+    get_pipeline,
+    request_cache_key,
+)
 
 
-@pytest.fixture
+def _fake_stream(*chunks):
+    """Build a stand-in for ``graph.astream`` that yields the given chunks."""
+
+    async def astream(*args, **kwargs):
+        for chunk in chunks:
+            yield chunk
+
+    return astream
+
+
+def _returns(result):
+    """Build a plain async stand-in for an agent's ``process`` that returns ``result``."""
+
+    async def process(state):
+        return result
+
+    return process
+
+
+def _updates(**fields):
+    """Build a plain async stand-in for an agent's ``process`` that merges ``fields``."""
+
+    async def process(state):
+        return {**state, **fields}
+
+    return process
+
+
+@pytest.fixture(scope="module")
 def sample_request():
-    """Create a sample content request."""
-    return ContentRequest(
+    """Create a sample content request, built once per module without validation."""
+    return ContentRequest.model_construct(
         topic="How to use AI for content marketing",
         content_type=ContentType.BLOG_POST,
         target_audience="Digital marketers",
@@ -28,10 +65,10 @@ def sample_request():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_research():
-    """Create mock research result."""
-    return ResearchResult(
+    """Create mock research result, built once per module without validation."""
+    return ResearchResult.model_construct(
         key_facts=["Fact 1", "Fact 2"],
         statistics=["Stat 1"],
         quotes=["Quote 1"],
@@ -39,10 +76,10 @@ def mock_research():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_outline():
-    """Create mock content outline."""
-    return ContentOutline(
+    """Create mock content outline, built once per module without validation."""
+    return ContentOutline.model_construct(
         title="AI Content Marketing Guide",
         hook="Transform your marketing.",
         sections=[
@@ -54,34 +91,90 @@ def mock_outline():
     )
 
 
+@pytest.fixture(scope="class")
+def _base_pipeline():
+    """Pipeline with mocked agents, built once per test class."""
+    with (
+        patch("src.workflows.content_pipeline.ResearcherAgent"),
+        patch("src.workflows.content_pipeline.PlannerAgent"),
+        patch("src.workflows.content_pipeline.WriterAgent"),
+        patch("src.workflows.content_pipeline.EditorAgent"),
+    ):
+        return ContentPipeline()
+
+
+@pytest.fixture
+def pipeline(_base_pipeline):
+    """Shared pipeline with fresh agent mocks, graph and response cache per test."""
+    for agent in (
+        _base_pipeline.researcher,
+        _base_pipeline.planner,
+        _base_pipeline.writer,
+        _base_pipeline.editor,
+    ):
+        agent.process = AsyncMock()
+    # Tests stub the stream on the graph instance; drop it to expose the real one
+    vars(_base_pipeline.graph).pop("astream", None)
+    _base_pipeline.response_cache = ResponseCache()
+    return _base_pipeline
+
+
+@patch.multiple(
+    "src.workflows.content_pipeline",
+    ResearcherAgent=DEFAULT,
+    PlannerAgent=DEFAULT,
+    WriterAgent=DEFAULT,
+    EditorAgent=DEFAULT,
+)
 class TestContentPipeline:
     """Test cases for ContentPipeline."""
 
-    @patch("src.workflows.content_pipeline.ResearcherAgent")
-    @patch("src.workflows.content_pipeline.PlannerAgent")
-    @patch("src.workflows.content_pipeline.WriterAgent")
-    @patch("src.workflows.content_pipeline.EditorAgent")
-    def test_pipeline_initialization(self, mock_editor, mock_writer, mock_planner, mock_researcher):
+    def test_pipeline_initialization(self, **agent_classes):
         """Test pipeline initializes with all agents."""
         pipeline = ContentPipeline()
 
-        mock_researcher.assert_called_once()
-        mock_planner.assert_called_once()
-        mock_writer.assert_called_once()
-        mock_editor.assert_called_once()
+        agent_classes["ResearcherAgent"].assert_called_once()
+        agent_classes["PlannerAgent"].assert_called_once()
+        agent_classes["WriterAgent"].assert_called_once()
+        agent_classes["EditorAgent"].assert_called_once()
 
         assert pipeline.graph is not None
 
-    @patch("src.workflows.content_pipeline.ResearcherAgent")
-    @patch("src.workflows.content_pipeline.PlannerAgent")
-    @patch("src.workflows.content_pipeline.WriterAgent")
-    @patch("src.workflows.content_pipeline.EditorAgent")
-    def test_graph_has_all_nodes(self, mock_editor, mock_writer, mock_planner, mock_researcher):
+    def test_graph_has_all_nodes(self, **agent_classes):
         """Test the graph contains all expected nodes."""
         pipeline = ContentPipeline()
 
         # The graph should be compiled successfully
         assert pipeline.graph is not None
+        assert set(pipeline.graph.nodes) >= {"research", "plan", "write", "edit", "finalize"}
+
+    def test_graph_compiled_once(self, **agent_classes):
+        """Test instances share compiled nodes but get their own graph object."""
+        first = ContentPipeline()
+        second = ContentPipeline()
+
+        assert first.graph is not second.graph
+        assert first.graph.nodes["research"] is second.graph.nodes["research"]
+
+    def test_agents_shared_between_pipelines(self, **agent_classes):
+        """Test repeated construction reuses one instance per agent class."""
+        first = ContentPipeline()
+        second = ContentPipeline()
+
+        agent_classes["ResearcherAgent"].assert_called_once()
+        agent_classes["EditorAgent"].assert_called_once()
+        assert first.researcher is second.researcher
+        assert first.editor is second.editor
+
+    def test_get_pipeline_builds_once_on_first_call(self, **agent_classes):
+        """Test the module pipeline is built lazily and then reused."""
+        get_pipeline.cache_clear()
+        try:
+            agent_classes["ResearcherAgent"].assert_not_called()
+            assert get_pipeline() is get_pipeline()
+            agent_classes["ResearcherAgent"].assert_called_once()
+        finally:
+            get_pipeline.cache_clear()
 
 
 class TestContentState:
@@ -98,7 +191,6 @@ class TestContentState:
             "outline": None,
             "draft_content": None,
             "content": None,
-            "started_at": datetime.utcnow(),
             "error": None,
         }
 
@@ -106,171 +198,74 @@ class TestContentState:
         assert state["content_id"] == "test-123"
         assert state["status"] == ContentStatus.PENDING
 
+    def test_messages_history_is_windowed(self):
+        """Test the messages reducer keeps only the most recent messages."""
+        reducer = ContentState.__annotations__["messages"].__metadata__[0]
+        history = [AIMessage(content=str(i)) for i in range(MESSAGES_WINDOW)]
+
+        merged = reducer(history, [AIMessage(content="new")])
+
+        assert len(merged) == MESSAGES_WINDOW
+        assert merged[0].content == "1"
+        assert merged[-1].content == "new"
+
 
 class TestPipelineNodes:
     """Test individual pipeline nodes."""
 
     @pytest.fixture
-    def pipeline(self):
-        """Create pipeline with mocked agents."""
-        with (
-            patch("src.workflows.content_pipeline.ResearcherAgent") as _mock_r,
-            patch("src.workflows.content_pipeline.PlannerAgent") as _mock_p,
-            patch("src.workflows.content_pipeline.WriterAgent") as _mock_w,
-            patch("src.workflows.content_pipeline.EditorAgent") as _mock_e,
-        ):
-            return ContentPipeline()
-
-    @pytest.mark.asyncio
-    async def test_research_node_success(self, pipeline, sample_request, mock_research):
-        """Test research node processes successfully."""
-        pipeline.researcher.process = AsyncMock(
-            return_value={
-                "research": mock_research,
+    def make_state(self, sample_request):
+        """Build node input states; keyword arguments override the defaults."""
+
+        def make(**overrides):
+            return {
+                "request": sample_request,
+                "content_id": "test-123",
+                "status": ContentStatus.PENDING,
                 "messages": [],
+                "research": None,
+                "outline": None,
+                "draft_content": None,
+                "content": None,
+                "error": None,
+                **overrides,
             }
-        )
 
-        state: ContentState = {
-            "request": sample_request,
-            "content_id": "test-123",
-            "status": ContentStatus.PENDING,
-            "messages": [],
-            "research": None,
-            "outline": None,
-            "draft_content": None,
-            "content": None,
-            "started_at": datetime.utcnow(),
-            "error": None,
-        }
+        return make
 
-        result = await pipeline._research_node(state)
+    @pytest.mark.parametrize(
+        ("agent", "node", "field", "status"),
+        [
+            ("researcher", "_research_node", "research", ContentStatus.RESEARCHING),
+            ("planner", "_plan_node", "outline", ContentStatus.PLANNING),
+            ("writer", "_write_node", "draft_content", ContentStatus.WRITING),
+            ("editor", "_edit_node", "content", ContentStatus.EDITING),
+        ],
+    )
+    async def test_node_success(self, pipeline, make_state, agent, node, field, status):
+        """Test each agent node keeps its agent's output and advances the status."""
+        output = f"{field} from {agent}"
+        getattr(pipeline, agent).process = _returns({field: output, "messages": []})
 
-        assert result["research"] == mock_research
-        assert result["status"] == ContentStatus.RESEARCHING
+        result = await getattr(pipeline, node)(make_state())
 
-    @pytest.mark.asyncio
-    async def test_research_node_failure(self, pipeline, sample_request):
-        """Test research node handles errors."""
-        pipeline.researcher.process = AsyncMock(side_effect=Exception("API Error"))
+        assert result[field] == output
+        assert result["status"] == status
 
-        state: ContentState = {
-            "request": sample_request,
-            "content_id": "test-123",
-            "status": ContentStatus.PENDING,
-            "messages": [],
-            "research": None,
-            "outline": None,
-            "draft_content": None,
-            "content": None,
-            "started_at": datetime.utcnow(),
-            "error": None,
-        }
+    async def test_research_node_failure(self, pipeline, make_state, fake_sleep):
+        """Test research node handles errors once its retries are exhausted."""
+        pipeline.researcher.process = AsyncMock(side_effect=Exception("API Error"))
 
-        result = await pipeline._research_node(state)
+        result = await pipeline._research_node(make_state())
 
         assert result["status"] == ContentStatus.FAILED
         assert "API Error" in result["error"]
+        assert pipeline.researcher.process.await_count == 3
+        assert fake_sleep.await_count == 2
 
-    @pytest.mark.asyncio
-    async def test_plan_node_success(self, pipeline, sample_request, mock_research, mock_outline):
-        """Test plan node processes successfully."""
-        pipeline.planner.process = AsyncMock(
-            return_value={
-                "outline": mock_outline,
-                "messages": [],
-            }
-        )
-
-        state: ContentState = {
-            "request": sample_request,
-            "content_id": "test-123",
-            "status": ContentStatus.RESEARCHING,
-            "messages": [],
-            "research": mock_research,
-            "outline": None,
-            "draft_content": None,
-            "content": None,
-            "started_at": datetime.utcnow(),
-            "error": None,
-        }
-
-        result = await pipeline._plan_node(state)
-
-        assert result["outline"] == mock_outline
-        assert result["status"] == ContentStatus.PLANNING
-
-    @pytest.mark.asyncio
-    async def test_write_node_success(self, pipeline, sample_request, mock_research, mock_outline):
-        """Test write node processes successfully."""
-        pipeline.writer.process = AsyncMock(
-            return_value={
-                "draft_content": "This is the draft content...",
-                "messages": [],
-            }
-        )
-
-        state: ContentState = {
-            "request": sample_request,
-            "content_id": "test-123",
-            "status": ContentStatus.PLANNING,
-            "messages": [],
-            "research": mock_research,
-            "outline": mock_outline,
-            "draft_content": None,
-            "content": None,
-            "started_at": datetime.utcnow(),
-            "error": None,
-        }
-
-        result = await pipeline._write_node(state)
-
-        assert result["draft_content"] == "This is the draft content..."
-        assert result["status"] == ContentStatus.WRITING
-
-    @pytest.mark.asyncio
-    async def test_edit_node_success(self, pipeline, sample_request):
-        """Test edit node processes successfully."""
-        pipeline.editor.process = AsyncMock(
-            return_value={
-                "content": "This is the final edited content.",
-                "messages": [],
-            }
-        )
-
-        state: ContentState = {
-            "request": sample_request,
-            "content_id": "test-123",
-            "status": ContentStatus.WRITING,
-            "messages": [],
-            "research": None,
-            "outline": None,
-            "draft_content": "Draft content here",
-            "content": None,
-            "started_at": datetime.utcnow(),
-            "error": None,
-        }
-
-        result = await pipeline._edit_node(state)
-
-        assert result["content"] == "This is the final edited content."
-        assert result["status"] == ContentStatus.EDITING
-
-    @pytest.mark.asyncio
-    async def test_finalize_node(self, pipeline, sample_request):
+    async def test_finalize_node(self, pipeline, make_state):
         """Test finalize node sets completed status."""
-        state: ContentState = {
-            "request": sample_request,
-            "content_id": "test-123",
-            "status": ContentStatus.EDITING,
-            "messages": [],
-            "research": None,
-            "outline": None,
-            "draft_content": None,
-            "content": "Final content",
-            "started_at": datetime.utcnow(),
-            "error": None,
-        }
+        state = make_state(status=ContentStatus.EDITING, content="Final content")
 
         result = await pipeline._finalize_node(state)
 
@@ -280,28 +275,20 @@ class TestPipelineNodes:
 class TestPipelineGenerate:
     """Test the generate method."""
 
-    @pytest.fixture
-    def pipeline(self):
-        """Create pipeline with mocked agents."""
-        with (
-            patch("src.workflows.content_pipeline.ResearcherAgent"),
-            patch("src.workflows.content_pipeline.PlannerAgent"),
-            patch("src.workflows.content_pipeline.WriterAgent"),
-            patch("src.workflows.content_pipeline.EditorAgent"),
-        ):
-            return ContentPipeline()
-
-    @pytest.mark.asyncio
     async def test_generate_returns_content_response(self, pipeline, sample_request):
         """Test generate returns a ContentResponse."""
-        # Mock the graph invoke
-        pipeline.graph.ainvoke = AsyncMock(
-            return_value={
-                "status": ContentStatus.COMPLETED,
-                "content": "Generated content here",
-                "research": None,
-                "outline": None,
-            }
+        # Mock the graph stream: one node update, then the merged final state
+        pipeline.graph.astream = _fake_stream(
+            ("updates", {"finalize": {"status": ContentStatus.COMPLETED}}),
+            (
+                "values",
+                {
+                    "status": ContentStatus.COMPLETED,
+                    "content": "Generated content here",
+                    "research": None,
+                    "outline": None,
+                },
+            ),
         )
 
         response = await pipeline.generate(sample_request)
@@ -312,12 +299,251 @@ class TestPipelineGenerate:
         assert response.content == "Generated content here"
         assert response.processing_time_seconds is not None
 
-    @pytest.mark.asyncio
     async def test_generate_handles_pipeline_error(self, pipeline, sample_request):
         """Test generate handles pipeline errors gracefully."""
-        pipeline.graph.ainvoke = AsyncMock(side_effect=Exception("Pipeline crashed"))
+        pipeline.graph.astream = MagicMock(side_effect=Exception("Pipeline crashed"))
 
         response = await pipeline.generate(sample_request)
 
         assert response.status == ContentStatus.FAILED
         assert response.content is None
+
+    async def test_generate_reports_phases_as_they_start(self, pipeline, sample_request):
+        """Test on_status gets the phase that starts after each finished node."""
+        pipeline.graph.astream = _fake_stream(
+            ("updates", {"research": {"status": ContentStatus.RESEARCHING}}),
+            ("updates", {"plan": {"status": ContentStatus.PLANNING}}),
+            ("updates", {"write": {"status": ContentStatus.WRITING}}),
+            ("updates", {"edit": {"status": ContentStatus.EDITING}}),
+            ("updates", {"finalize": {"status": ContentStatus.COMPLETED}}),
+            ("values", {"status": ContentStatus.COMPLETED, "content": "Final"}),
+        )
+        on_status = AsyncMock()
+
+        await pipeline.generate(sample_request, on_status=on_status)
+
+        assert [call.args[0] for call in on_status.await_args_list] == [
+            ContentStatus.RESEARCHING,
+            ContentStatus.PLANNING,
+            ContentStatus.WRITING,
+            ContentStatus.EDITING,
+        ]
+
+    async def test_generate_reports_no_phase_after_failure(self, pipeline, sample_request):
+        """Test a failed node does not announce the phase that would follow it."""
+        pipeline.graph.astream = _fake_stream(
+            ("updates", {"research": {"status": ContentStatus.FAILED}}),
+            ("updates", {"finalize": {"status": ContentStatus.FAILED}}),
+            ("values", {"status": ContentStatus.FAILED}),
+        )
+        on_status = AsyncMock()
+
+        await pipeline.generate(sample_request, on_status=on_status)
+
+        on_status.assert_awaited_once_with(ContentStatus.RESEARCHING)
+
+    async def test_generate_plans_from_research(
+        self, pipeline, sample_request, mock_research, mock_outline
+    ):
+        """Test the planner gets the research and both feed the writer."""
+        research_message = AIMessage(content="research")
+        outline_message = AIMessage(content="outline")
+        pipeline.researcher.process = AsyncMock(
+            side_effect=lambda state: {
+                **state,
+                "research": mock_research,
+                "messages": state["messages"] + [research_message],
+            }
+        )
+        pipeline.planner.process = AsyncMock(
+            side_effect=lambda state: {
+                **state,
+                "outline": mock_outline,
+                "messages": state["messages"] + [outline_message],
+            }
+        )
+        pipeline.writer.process = AsyncMock(
+            side_effect=lambda state: {**state, "draft_content": "Draft"}
+        )
+        pipeline.editor.process = AsyncMock(side_effect=lambda state: {**state, "content": "Final"})
+
+        response = await pipeline.generate(sample_request)
+
+        assert response.status == ContentStatus.COMPLETED
+        assert response.research == mock_research
+        assert response.outline == mock_outline
+        assert pipeline.planner.process.call_args.args[0]["research"] == mock_research
+        writer_state = pipeline.writer.process.call_args.args[0]
+        assert writer_state["research"] == mock_research
+        assert writer_state["outline"] == mock_outline
+        assert writer_state["messages"] == [research_message, outline_message]
+
+    async def test_generate_fails_when_planning_fails(self, pipeline, sample_request):
+        """Test a planning failure stops the pipeline even if research succeeds."""
+        pipeline.researcher.process = _updates()
+        pipeline.planner.process = AsyncMock(side_effect=KeyError("title"))
+        pipeline.writer.process = AsyncMock()
+
+        response = await pipeline.generate(sample_request)
+
+        assert response.status == ContentStatus.FAILED
+        pipeline.writer.process.assert_not_called()
+
+    async def test_generate_skips_planning_after_research_fails(
+        self, pipeline, sample_request, fake_sleep
+    ):
+        """Test a research failure routes straight to finalize without planning."""
+        pipeline.researcher.process = AsyncMock(side_effect=Exception("API Error"))
+        pipeline.planner.process = AsyncMock()
+
+        events = [event async for event in pipeline.generate_stream(sample_request)]
+
+        assert [node_name for node_name, _ in events] == ["research", "finalize", "__end__"]
+        assert events[-1][1]["status"] == ContentStatus.FAILED
+        pipeline.planner.process.assert_not_called()
+
+    async def test_generate_skips_editing_after_writing_fails(self, pipeline, sample_request):
+        """Test a writing failure routes straight to finalize without editing."""
+        pipeline.researcher.process = _updates()
+        pipeline.planner.process = _updates()
+        pipeline.writer.process = AsyncMock(side_effect=KeyError("draft"))
+        pipeline.editor.process = AsyncMock()
+
+        events = [event async for event in pipeline.generate_stream(sample_request)]
+
+        assert [node_name for node_name, _ in events][-3:] == ["write", "finalize", "__end__"]
+        assert events[-1][1]["status"] == ContentStatus.FAILED
+        pipeline.editor.process.assert_not_called()
+
+    async def test_generate_stream_yields_node_updates(
+        self, pipeline, sample_request, mock_research, mock_outline
+    ):
+        """Test generate_stream yields each node update, then the final state."""
+        pipeline.researcher.process = _updates(research=mock_research)
+        pipeline.planner.process = _updates(outline=mock_outline)
+        pipeline.writer.process = _updates(draft_content="Draft")
+        pipeline.editor.process = _updates(content="Final")
+
+        events = [event async for event in pipeline.generate_stream(sample_request, "stream-1")]
+        nodes = [node_name for node_name, _ in events]
+
+        assert nodes == ["research", "plan", "write", "edit", "finalize", "__end__"]
+        assert events[0][1]["research"] == mock_research
+
+        final_state = events[-1][1]
+        assert final_state["content_id"] == "stream-1"
+        assert final_state["content"] == "Final"
+        assert final_state["status"] == ContentStatus.COMPLETED
+
+    async def test_generate_batch_limits_concurrency(self, pipeline, sample_request):
+        """Test generate_batch keeps request order and bounds concurrency."""
+        running = 0
+        peak = 0
+
+        async def fake_generate(request):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return request.topic
+
+        requests = [sample_request.model_copy(update={"topic": f"Topic {i}"}) for i in range(5)]
+
+        with patch.object(pipeline, "generate", side_effect=fake_generate):
+            results = await pipeline.generate_batch(requests, max_concurrency=2)
+
+        assert results == [f"Topic {i}" for i in range(5)]
+        assert peak == 2
+
+    async def test_generate_reuses_cached_response(self, pipeline, sample_request):
+        """Test an equivalent request is served from the cache without running the graph."""
+        pipeline.graph.astream = MagicMock(
+            side_effect=_fake_stream(
+                ("values", {"status": ContentStatus.COMPLETED, "content": "Cached content"})
+            )
+        )
+
+        first = await pipeline.generate(sample_request)
+        equivalent = sample_request.model_copy(
+            update={"topic": f"  {sample_request.topic.upper()} "}
+        )
+        second = await pipeline.generate(equivalent)
+
+        assert pipeline.graph.astream.call_count == 1
+        assert second.content == "Cached content"
+        assert second.id != first.id
+        assert second.request == equivalent
+
+    @pytest.mark.parametrize(
+        ("use_cache", "cache_enabled"),
+        [
+            (False, True),  # Per-request bypass
+            (True, False),  # Cache turned off in settings
+        ],
+    )
+    async def test_generate_bypassing_cache_runs_agents(
+        self, pipeline, sample_request, monkeypatch, use_cache, cache_enabled
+    ):
+        """Test a bypassed cache runs the agents again for an equivalent request."""
+        monkeypatch.setattr(settings, "response_cache_enabled", cache_enabled)
+        pipeline.researcher.process = AsyncMock(side_effect=_updates())
+        pipeline.planner.process = _updates()
+        pipeline.writer.process = _updates(draft_content="Draft")
+        pipeline.editor.process = _updates(content="Final")
+
+        await pipeline.generate(sample_request)
+        second = await pipeline.generate(sample_request, use_cache=use_cache)
+
+        assert pipeline.researcher.process.await_count == 2
+        assert second.status == ContentStatus.COMPLETED
+        assert second.content == "Final"
+
+    async def test_generate_does_not_cache_failures(self, pipeline, sample_request):
+        """Test failed generations are retried instead of served from the cache."""
+        pipeline.graph.astream = MagicMock(
+            side_effect=_fake_stream(("values", {"status": ContentStatus.FAILED}))
+        )
+
+        await pipeline.generate(sample_request)
+        await pipeline.generate(sample_request)
+
+        assert pipeline.graph.astream.call_count == 2
+
+
+class TestResponseCache:
+    """Test the in-process response cache."""
+
+    def test_key_ignores_case_whitespace_and_keyword_order(self, sample_request):
+        """Test equivalent requests share a cache key."""
+        a = sample_request.model_copy(update={"keywords": ["AI", "marketing"]})
+        b = sample_request.model_copy(
+            update={"topic": sample_request.topic.lower() + "  ", "keywords": ["marketing", "ai"]}
+        )
+
+        assert request_cache_key(a) == request_cache_key(b)
+        assert request_cache_key(a) != request_cache_key(a.model_copy(update={"word_count": 500}))
+
+    def test_expired_entries_are_dropped(self, sample_request, monkeypatch):
+        """Test entries older than the TTL are not returned."""
+        cache = ResponseCache(ttl_seconds=10)
+        response = MagicMock()
+        now = 1000.0
+        monkeypatch.setattr("src.workflows.content_pipeline.time.monotonic", lambda: now)
+
+        cache.put(sample_request, response)
+        assert cache.get(sample_request) is response.model_copy.return_value
+
+        now += 11
+        assert cache.get(sample_request) is None
+
+    def test_evicts_least_recently_used(self, sample_request):
+        """Test the cache is bounded by max_entries."""
+        cache = ResponseCache(max_entries=2)
+        requests = [sample_request.model_copy(update={"word_count": n}) for n in (500, 600, 700)]
+
+        for request in requests:
+            cache.put(request, MagicMock())
+
+        assert cache.get(requests[0]) is None
+        assert cache.get(requests[2]) is not None
@@ -1,12 +1,38 @@
 """Content Mate - Streamlit UI Application."""
 
+import atexit
+import io
+import json
+import random
 import time
+import uuid
+import zipfile
+from collections.abc import Iterator
 
 import httpx
+import pandas as pd
 import streamlit as st
 
 # Configuration
-API_BASE_URL = "http://localhost:8000/api/v1"
+API_ROOT_URL = "http://localhost:8000"
+API_BASE_URL = f"{API_ROOT_URL}/api/v1"
+
+
+@st.cache_resource
+def get_http() -> httpx.Client:
+    """Get the pooled API client shared by every session and rerun.
+
+    Reusing one client keeps connections alive between requests instead of
+    opening a new one for each call.
+    """
+    client = httpx.Client(
+        base_url=API_BASE_URL,
+        timeout=10.0,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+    )
+    atexit.register(client.close)
+    return client
+
 
 st.set_page_config(
     page_title="콘텐츠 메이트",
@@ -74,6 +100,11 @@ if "current_content_id" not in st.session_state:
     st.session_state.current_content_id = None
 if "generated_result" not in st.session_state:
     st.session_state.generated_result = None
+if "client_id" not in st.session_state:
+    # Identifies this browser session to the API's per-client throttle, since
+    # every session's requests come from this one server; the API honours it
+    # once this host is listed in its TRUSTED_PROXY_HOSTS
+    st.session_state.client_id = uuid.uuid4().hex
 
 STATUS_LABELS = {
     "completed": "완료",
@@ -85,6 +116,10 @@ STATUS_LABELS = {
     "failed": "실패",
 }
 
+# Seconds between status polls: quick checks right after a phase change, then
+# backing off towards the 2 s ceiling while a long phase runs
+POLL_DELAYS = (0.2, 0.2, 0.5, 0.5, 1.0, 1.0, 2.0)
+
 CONTENT_TYPE_LABELS = {
     "blog_post": "블로그 글",
     "article": "기사",
@@ -93,6 +128,38 @@ CONTENT_TYPE_LABELS = {
     "landing_page": "랜딩 페이지",
 }
 
+STATUS_EMOJI = {
+    "completed": "✅",
+    "failed": "❌",
+    "pending": "⏳",
+    "researching": "🔍",
+    "planning": "📋",
+    "writing": "✍️",
+    "editing": "✨",
+}
+
+# Progress phases: (status, icon, name, description), in pipeline order
+PHASES = (
+    ("pending", "⏳", "초기화", "콘텐츠 생성을 시작합니다..."),
+    ("researching", "🔍", "리서치", "주제에 대한 정보를 수집합니다..."),
+    ("planning", "📋", "기획", "콘텐츠 개요를 작성합니다..."),
+    ("writing", "✍️", "작성", "초안을 작성합니다..."),
+    ("editing", "✨", "편집", "콘텐츠를 다듬고 개선합니다..."),
+    ("completed", "✅", "완료", "콘텐츠 생성이 완료되었습니다!"),
+)
+
+PHASE_INDEX = {status: i for i, (status, *_) in enumerate(PHASES)}
+
+# Export downloads: (format, label, bundle entry and download name, MIME type);
+# the "PDF" export is print-ready HTML, so it downloads as an .html file
+EXPORT_FORMATS = (
+    ("markdown", "📄 마크다운", "content.md", "text/markdown"),
+    ("html", "🌐 HTML", "content.html", "text/html"),
+    ("pdf", "📑 PDF", "content-print.html", "text/html"),
+    ("json", "📦 JSON", "content.json", "application/json"),
+    ("txt", "📝 텍스트", "content.txt", "text/plain"),
+)
+
 
 def main():
     """Main application entry point."""
@@ -228,12 +295,13 @@ def create_content_tab(content_type: str, tone: str, word_count: int, language:
             st.error("🔴 API 서버 오프라인")
             st.caption("다음 명령으로 시작하세요: `uv run uvicorn src.api.main:app --reload`")
 
-    # Generate button
+    # Generate button, disabled while a generation runs so repeated clicks
+    # cannot submit duplicate jobs
     if st.button(
         "🚀 콘텐츠 생성",
         type="primary",
         use_container_width=True,
-        disabled=not api_status,
+        disabled=not api_status or st.session_state.generation_in_progress,
     ):
         if not topic or len(topic.strip()) < 5:
             st.error("주제를 입력해 주세요 (최소 5자)!")
@@ -251,45 +319,72 @@ def create_content_tab(content_type: str, tone: str, word_count: int, language:
             "additional_instructions": additional_instructions or None,
         }
 
-        # Generate with progress
+        # Rerun first so the button is drawn disabled before the request goes out
+        st.session_state.pending_request = request_data
+        st.session_state.generation_in_progress = True
+        st.rerun()
+
+    # Generate with progress
+    request_data = st.session_state.pop("pending_request", None)
+    if request_data is not None:
         generate_content_with_progress(request_data)
 
 
+@st.cache_data(ttl=5, show_spinner=False)
 def check_api_status() -> bool:
-    """Check if API server is running."""
+    """Check if API server is running.
+
+    Cached briefly so widget reruns do not each ping ``/health``.
+    """
     try:
-        with httpx.Client(timeout=2.0) as client:
-            response = client.get(f"{API_BASE_URL.replace('/api/v1', '')}/health")
-            return response.status_code == 200
+        response = get_http().get(f"{API_ROOT_URL}/health", timeout=2.0)
+        return response.status_code == 200
     except Exception:
         return False
 
 
-def generate_content_with_progress(request_data: dict):
-    """Generate content with real-time progress visualization."""
+def stream_status_events(content_id: str) -> Iterator[dict | None]:
+    """Follow a generation job through the API's Server-Sent Events stream.
 
-    # Progress phases configuration
-    phases = [
-        ("pending", "⏳", "초기화", "콘텐츠 생성을 시작합니다..."),
-        ("researching", "🔍", "리서치", "주제에 대한 정보를 수집합니다..."),
-        ("planning", "📋", "기획", "콘텐츠 개요를 작성합니다..."),
-        ("writing", "✍️", "작성", "초안을 작성합니다..."),
-        ("editing", "✨", "편집", "콘텐츠를 다듬고 개선합니다..."),
-        ("completed", "✅", "완료", "콘텐츠 생성이 완료되었습니다!"),
-    ]
+    Args:
+        content_id: Content ID to follow
 
-    phase_order = ["pending", "researching", "planning", "writing", "editing", "completed"]
+    Yields:
+        The content record on every status change, or ``None`` for a keep-alive
+        so callers can check their own timeout
 
+    Raises:
+        httpx.HTTPStatusError: If the stream is unavailable, e.g. 404 from an
+            older API without the endpoint
+    """
+    # The server sends a keep-alive at least every 15 seconds while a job runs
+    timeout = httpx.Timeout(10.0, read=60.0)
+    with get_http().stream("GET", f"/content/{content_id}/stream", timeout=timeout) as response:
+        response.raise_for_status()
+        for line in response.iter_lines():
+            if line.startswith("data:"):
+                yield json.loads(line[5:])
+            elif line.startswith(":"):
+                yield None
+
+
+def generate_content_with_progress(request_data: dict):
+    """Generate content with real-time progress visualization."""
     try:
         # Start async generation
-        with httpx.Client(timeout=10.0) as client:
-            response = client.post(
-                f"{API_BASE_URL}/content/generate/async",
-                json=request_data,
-            )
-            response.raise_for_status()
-            data = response.json()
-            content_id = data["content_id"]
+        response = get_http().post(
+            "/content/generate/async",
+            json=request_data,
+            headers={"X-Client-ID": st.session_state.client_id},
+        )
+        if response.status_code == 429:
+            retry_after = response.headers.get("Retry-After")
+            wait = f"{retry_after}초 후" if retry_after else "잠시 후"
+            st.warning(f"⏳ 요청이 너무 잦습니다. {wait} 다시 시도해 주세요.")
+            return
+        response.raise_for_status()
+        data = response.json()
+        content_id = data["content_id"]
 
         st.session_state.current_content_id = content_id
 
@@ -302,9 +397,9 @@ def generate_content_with_progress(request_data: dict):
 
         # Phase status display
         with phase_container:
-            phase_cols = st.columns(len(phases))
+            phase_cols = st.columns(len(PHASES))
             phase_placeholders = []
-            for i, (_, icon, name, _) in enumerate(phases):
+            for i, (_, icon, name, _) in enumerate(PHASES):
                 with phase_cols[i]:
                     phase_placeholders.append(st.empty())
                     phase_placeholders[i].markdown(
@@ -315,10 +410,96 @@ def generate_content_with_progress(request_data: dict):
         status_text = st.empty()
         time_text = st.empty()
 
-        # Poll for status
+        # Phase currently drawn as active; -1 while every phase shows as pending
+        last_phase_idx = -1
+
+        def show_status(result: dict, elapsed: float) -> bool:
+            """Render one status update; returns True once generation has finished."""
+            nonlocal last_phase_idx
+            status = result.get("status", "pending")
+
+            # Update progress only when the phase moved; phases outside the
+            # old..new range look the same before and after
+            new_phase_idx = PHASE_INDEX.get(status, last_phase_idx)
+            if new_phase_idx != last_phase_idx:
+                low = max(min(last_phase_idx, new_phase_idx), 0)
+                high = max(last_phase_idx, new_phase_idx)
+                last_phase_idx = new_phase_idx
+
+                # Update phase display
+                for i in range(low, high + 1):
+                    _phase_status, icon, name, desc = PHASES[i]
+                    if i < new_phase_idx:
+                        # Completed phase
+                        phase_placeholders[i].markdown(
+                            f'<div class="phase-box phase-complete">✅ {name}</div>',
+                            unsafe_allow_html=True,
+                        )
+                    elif i == new_phase_idx:
+                        # Active phase
+                        phase_placeholders[i].markdown(
+                            f'<div class="phase-box phase-active">{icon} {name}</div>',
+                            unsafe_allow_html=True,
+                        )
+                        status_text.info(f"**{name}:** {desc}")
+                    else:
+                        # Pending phase
+                        phase_placeholders[i].markdown(
+                            f'<div class="phase-box phase-pending">{icon} {name}</div>',
+                            unsafe_allow_html=True,
+                        )
+
+                # Update progress bar
+                progress = int((new_phase_idx / (len(PHASES) - 1)) * 100)
+                progress_bar.progress(progress)
+
+            # Update time display
+            time_text.caption(f"⏱️ 경과 시간: {elapsed:.0f}초")
+
+            # Check if completed
+            if status == "completed":
+                progress_bar.progress(100)
+                status_text.success("✅ 콘텐츠 생성 완료!")
+
+                # Store result and refresh
+                st.session_state.generated_result = result
+                st.session_state.generation_in_progress = False
+                list_content.clear()
+                time.sleep(1)
+                st.rerun()
+                return True
+
+            # Check if failed
+            if status == "failed":
+                progress_bar.progress(0)
+                status_text.error("❌ 콘텐츠 생성 실패")
+                st.error(result.get("error", "알 수 없는 오류"))
+                return True
+
+            return False
+
         start_time = time.time()
         max_wait_time = 600  # 10 minutes
-        poll_interval = 2  # 2 seconds
+
+        # Follow the job over one event stream: updates arrive as each phase
+        # finishes, without re-requesting the record
+        try:
+            for result in stream_status_events(content_id):
+                elapsed = time.time() - start_time
+                if elapsed > max_wait_time:
+                    st.error("⏰ 생성 시간이 초과되었습니다. 다시 시도해 주세요.")
+                    return
+                if result is not None and show_status(result, elapsed):
+                    return
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code != 404:
+                raise
+        except httpx.TransportError as e:
+            st.warning(f"진행 상황 스트림 연결 끊김 (폴링으로 전환): {e}")
+
+        # The API has no event stream, or it dropped early: poll for status
+        poll_count = 0
+        last_status = None
 
         while True:
             elapsed = time.time() - start_time
@@ -329,75 +510,52 @@ def generate_content_with_progress(request_data: dict):
 
             # Get current status
             try:
-                with httpx.Client(timeout=10.0) as client:
-                    response = client.get(f"{API_BASE_URL}/content/{content_id}")
-
-                    if response.status_code == 200:
-                        result = response.json()
-                        status = result.get("status", "pending")
-
-                        # Update progress
-                        if status in phase_order:
-                            new_phase_idx = phase_order.index(status)
-
-                            # Update phase display
-                            for i, (_phase_status, icon, name, desc) in enumerate(phases):
-                                if i < new_phase_idx:
-                                    # Completed phase
-                                    phase_placeholders[i].markdown(
-                                        f'<div class="phase-box phase-complete">✅ {name}</div>',
-                                        unsafe_allow_html=True,
-                                    )
-                                elif i == new_phase_idx:
-                                    # Active phase
-                                    phase_placeholders[i].markdown(
-                                        f'<div class="phase-box phase-active">{icon} {name}</div>',
-                                        unsafe_allow_html=True,
-                                    )
-                                    status_text.info(f"**{name}:** {desc}")
-                                else:
-                                    # Pending phase
-                                    phase_placeholders[i].markdown(
-                                        f'<div class="phase-box phase-pending">{icon} {name}</div>',
-                                        unsafe_allow_html=True,
-                                    )
+                response = get_http().get(f"/content/{content_id}")
 
-                            # Update progress bar
-                            progress = int((new_phase_idx / (len(phases) - 1)) * 100)
-                            progress_bar.progress(progress)
+                if response.status_code == 200:
+                    result = response.json()
+                    if show_status(result, elapsed):
+                        return
 
-                        # Update time display
-                        time_text.caption(f"⏱️ 경과 시간: {elapsed:.0f}초")
-
-                        # Check if completed
-                        if status == "completed":
-                            progress_bar.progress(100)
-                            status_text.success("✅ 콘텐츠 생성 완료!")
-
-                            # Store result and refresh
-                            st.session_state.generated_result = result
-                            st.session_state.generation_in_progress = False
-                            time.sleep(1)
-                            st.rerun()
-                            return
-
-                        # Check if failed
-                        if status == "failed":
-                            progress_bar.progress(0)
-                            status_text.error("❌ 콘텐츠 생성 실패")
-                            st.error(result.get("error", "알 수 없는 오류"))
-                            return
+                    # A new phase just started: go back to short intervals
+                    if result.get("status") != last_status:
+                        last_status = result.get("status")
+                        poll_count = 0
 
             except Exception as e:
                 st.warning(f"상태 확인 오류 (재시도 중): {e}")
 
-            time.sleep(poll_interval)
+            # ±10% jitter keeps several open tabs from polling in lockstep
+            delay = POLL_DELAYS[min(poll_count, len(POLL_DELAYS) - 1)]
+            time.sleep(delay * random.uniform(0.9, 1.1))
+            poll_count += 1
 
     except httpx.ConnectError:
         st.error("❌ API 서버에 연결할 수 없습니다")
         st.info("서버가 실행 중인지 확인하세요: `uv run uvicorn src.api.main:app --reload`")
     except Exception as e:
         st.error(f"오류: {str(e)}")
+    finally:
+        # Also runs when a widget interaction interrupts this script run
+        st.session_state.generation_in_progress = False
+
+
+def fetch_export_bundle(content_id: str) -> zipfile.ZipFile | None:
+    """Download every export format of a content item in one ZIP bundle.
+
+    Args:
+        content_id: Content ID
+
+    Returns:
+        The opened archive, or ``None`` if the export could not be fetched
+    """
+    try:
+        response = get_http().get(f"/content/{content_id}/export/bundle")
+    except httpx.HTTPError:
+        return None
+    if response.status_code != 200:
+        return None
+    return zipfile.ZipFile(io.BytesIO(response.content))
 
 
 def display_generated_content(result: dict):
@@ -449,39 +607,20 @@ def display_generated_content(result: dict):
         content_id = result.get("id")
         export_cols = st.columns(5)
 
-        formats = [
-            ("markdown", "📄 마크다운"),
-            ("html", "🌐 HTML"),
-            ("pdf", "📑 PDF"),
-            ("json", "📦 JSON"),
-            ("txt", "📝 텍스트"),
-        ]
+        bundle = fetch_export_bundle(content_id)
 
-        for i, (fmt, label) in enumerate(formats):
+        for i, (fmt, label, file_name, mime) in enumerate(EXPORT_FORMATS):
             with export_cols[i]:
-                try:
-                    with httpx.Client(timeout=10.0) as client:
-                        response = client.get(
-                            f"{API_BASE_URL}/content/{content_id}/export",
-                            params={"format": fmt},
-                        )
-                        if response.status_code == 200:
-                            ext = {
-                                "markdown": "md",
-                                "html": "html",
-                                "pdf": "html",
-                                "json": "json",
-                                "txt": "txt",
-                            }[fmt]
-                            st.download_button(
-                                label=label,
-                                data=response.content,
-                                file_name=f"content.{ext}",
-                                mime=response.headers.get("content-type"),
-                                key=f"download_{fmt}",
-                            )
-                except Exception:
+                if bundle is None:
                     st.button(label, disabled=True, key=f"btn_{fmt}")
+                else:
+                    st.download_button(
+                        label=label,
+                        data=bundle.read(file_name),
+                        file_name=file_name,
+                        mime=mime,
+                        key=f"download_{fmt}",
+                    )
     else:
         st.warning("생성된 콘텐츠가 없습니다")
 
@@ -529,99 +668,110 @@ def display_generated_content(result: dict):
             st.info("위 텍스트를 선택해 복사하세요!")
 
 
+@st.cache_data(ttl=3, show_spinner=False)
+def list_content() -> list[dict] | None:
+    """Fetch the content list shared by the history and dashboard tabs.
+
+    Returns:
+        Content items, or ``None`` if the API answered with an error status
+    """
+    response = get_http().get("/content", timeout=30.0)
+    return response.json() if response.status_code == 200 else None
+
+
+@st.fragment
 def history_tab():
-    """Content history tab."""
+    """Content history tab.
+
+    Runs as a fragment: refresh and delete clicks rerun only this tab.
+    """
     st.header("📚 콘텐츠 기록")
 
     # Refresh button
     col1, col2 = st.columns([4, 1])
     with col2:
         if st.button("🔄 새로고침"):
-            st.rerun()
+            # The click itself reruns this fragment; just drop the cached list
+            list_content.clear()
 
     try:
-        with httpx.Client(timeout=30.0) as client:
-            response = client.get(f"{API_BASE_URL}/content")
-            if response.status_code == 200:
-                items = response.json()
-
-                if not items:
-                    st.info("📝 아직 생성된 콘텐츠가 없습니다. 첫 콘텐츠를 만들어 보세요!")
-                    return
+        items = list_content()
+        if items is not None:
+            if not items:
+                st.info("📝 아직 생성된 콘텐츠가 없습니다. 첫 콘텐츠를 만들어 보세요!")
+                return
 
-                # Summary stats
-                completed = sum(1 for i in items if i["status"] == "completed")
-                failed = sum(1 for i in items if i["status"] == "failed")
-
-                stat_cols = st.columns(3)
-                with stat_cols[0]:
-                    st.metric("전체", len(items))
-                with stat_cols[1]:
-                    st.metric("✅ 완료", completed)
-                with stat_cols[2]:
-                    st.metric("❌ 실패", failed)
-
-                st.divider()
-
-                # Content list
-                for item in items:
-                    topic = item["request"]["topic"][:60]
-                    status = item["status"]
-                    status_label = STATUS_LABELS.get(status, status)
-                    content_type_label = CONTENT_TYPE_LABELS.get(
-                        item["request"]["content_type"],
-                        item["request"]["content_type"],
-                    )
-                    status_emoji = {
-                        "completed": "✅",
-                        "failed": "❌",
-                        "pending": "⏳",
-                        "researching": "🔍",
-                        "planning": "📋",
-                        "writing": "✍️",
-                        "editing": "✨",
-                    }.get(status, "❓")
-
-                    with st.expander(f"{status_emoji} {topic}..."):
-                        col1, col2 = st.columns([3, 1])
-                        with col1:
-                            st.markdown(f"**유형:** {content_type_label}")
-                            st.markdown(f"**상태:** {status_label}")
-                            st.markdown(f"**ID:** `{item['id'][:8]}...`")
-                        with col2:
-                            if item.get("processing_time_seconds"):
-                                st.metric("시간", f"{item['processing_time_seconds']:.1f}초")
-
-                        if item.get("content"):
-                            st.markdown("---")
-                            preview = item["content"][:500]
-                            st.markdown(preview + ("..." if len(item["content"]) > 500 else ""))
-
-                            # Actions
-                            action_cols = st.columns([1, 1, 2])
-                            with action_cols[0]:
-                                # Export button
+            # Summary stats
+            completed = sum(1 for i in items if i["status"] == "completed")
+            failed = sum(1 for i in items if i["status"] == "failed")
+
+            stat_cols = st.columns(3)
+            with stat_cols[0]:
+                st.metric("전체", len(items))
+            with stat_cols[1]:
+                st.metric("✅ 완료", completed)
+            with stat_cols[2]:
+                st.metric("❌ 실패", failed)
+
+            st.divider()
+
+            # Content list
+            for item in items:
+                topic = item["request"]["topic"][:60]
+                status = item["status"]
+                status_label = STATUS_LABELS.get(status, status)
+                content_type_label = CONTENT_TYPE_LABELS.get(
+                    item["request"]["content_type"],
+                    item["request"]["content_type"],
+                )
+                status_emoji = STATUS_EMOJI.get(status, "❓")
+
+                with st.expander(f"{status_emoji} {topic}..."):
+                    col1, col2 = st.columns([3, 1])
+                    with col1:
+                        st.markdown(f"**유형:** {content_type_label}")
+                        st.markdown(f"**상태:** {status_label}")
+                        st.markdown(f"**ID:** `{item['id'][:8]}...`")
+                        st.markdown(f"**단어 수:** {item['word_count']}")
+                    with col2:
+                        if item.get("processing_time_seconds"):
+                            st.metric("시간", f"{item['processing_time_seconds']:.1f}초")
+
+                    if item.get("content_preview"):
+                        st.markdown("---")
+                        st.markdown(item["content_preview"])
+
+                        # Actions
+                        action_cols = st.columns([1, 1, 2])
+                        with action_cols[0]:
+                            # Export button: the file is fetched only when asked
+                            # for, then kept in session state for the download
+                            export_key = f"history_export_{item['id']}"
+                            if export_key in st.session_state:
+                                st.download_button(
+                                    "📥 다운로드",
+                                    data=st.session_state[export_key],
+                                    file_name="content.md",
+                                    key=f"export_{item['id']}",
+                                )
+                            elif st.button("📥 내보내기", key=f"prepare_export_{item['id']}"):
                                 try:
-                                    with httpx.Client(timeout=10.0) as exp_client:
-                                        exp_response = exp_client.get(
-                                            f"{API_BASE_URL}/content/{item['id']}/export",
-                                            params={"format": "markdown"},
-                                        )
-                                        if exp_response.status_code == 200:
-                                            st.download_button(
-                                                "📥 내보내기",
-                                                data=exp_response.content,
-                                                file_name="content.md",
-                                                key=f"export_{item['id']}",
-                                            )
-                                except Exception:
-                                    pass
-
-                            with action_cols[1]:
-                                if st.button("🗑️ 삭제", key=f"delete_{item['id']}"):
-                                    delete_content(item["id"])
-            else:
-                st.warning("기록을 불러올 수 없습니다")
+                                    exp_response = get_http().get(
+                                        f"/content/{item['id']}/export",
+                                        params={"format": "markdown"},
+                                    )
+                                except httpx.HTTPError:
+                                    exp_response = None
+                                if exp_response is not None and exp_response.status_code == 200:
+                                    st.session_state[export_key] = exp_response.content
+                                    st.rerun(scope="fragment")
+                                st.warning("내보내기에 실패했습니다")
+
+                        with action_cols[1]:
+                            if st.button("🗑️ 삭제", key=f"delete_{item['id']}"):
+                                delete_content(item["id"])
+        else:
+            st.warning("기록을 불러올 수 없습니다")
     except httpx.ConnectError:
         st.info("🔌 API 서버를 사용할 수 없습니다. 서버를 실행한 뒤 기록을 확인하세요.")
     except Exception as e:
@@ -631,38 +781,40 @@ def history_tab():
 def delete_content(content_id: str):
     """Delete content by ID."""
     try:
-        with httpx.Client(timeout=10.0) as client:
-            response = client.delete(f"{API_BASE_URL}/content/{content_id}")
-            if response.status_code == 200:
-                st.success("✅ 콘텐츠가 삭제되었습니다!")
-                time.sleep(0.5)
-                st.rerun()
-            else:
-                st.error("콘텐츠 삭제에 실패했습니다")
+        response = get_http().delete(f"/content/{content_id}")
+        if response.status_code == 200:
+            list_content.clear()
+            st.session_state.pop(f"history_export_{content_id}", None)
+            st.success("✅ 콘텐츠가 삭제되었습니다!")
+            time.sleep(0.5)
+            st.rerun(scope="fragment")
+        else:
+            st.error("콘텐츠 삭제에 실패했습니다")
     except Exception as e:
         st.error(f"삭제 오류: {e}")
 
 
+@st.fragment(run_every=5)
 def dashboard_tab():
-    """Dashboard/analytics tab."""
+    """Dashboard/analytics tab, refreshed on its own every 5 seconds."""
     st.header("📊 대시보드")
 
     # Fetch data
     try:
-        with httpx.Client(timeout=10.0) as client:
-            response = client.get(f"{API_BASE_URL}/content")
-            items = response.json() if response.status_code == 200 else []
+        items = list_content() or []
     except Exception:
         items = []
 
+    # One frame for every aggregate below; nested request fields become
+    # dotted columns such as "request.content_type"
+    df = pd.json_normalize(items)
+
     # Metrics
     col1, col2, col3, col4 = st.columns(4)
 
-    total = len(items)
-    completed = sum(1 for i in items if i["status"] == "completed")
-    avg_time = sum(
-        i.get("processing_time_seconds", 0) for i in items if i.get("processing_time_seconds")
-    ) / max(completed, 1)
+    total = len(df)
+    completed = int(df["status"].eq("completed").sum()) if total else 0
+    avg_time = df["processing_time_seconds"].sum() / max(completed, 1) if total else 0.0
     success_rate = (completed / total * 100) if total > 0 else 0
 
     with col1:
@@ -685,31 +837,25 @@ def dashboard_tab():
 
     with col1:
         st.subheader("📊 콘텐츠 유형별")
-        type_counts = {}
-        for item in items:
-            ct = item["request"]["content_type"]
-            ct_label = CONTENT_TYPE_LABELS.get(ct, ct)
-            type_counts[ct_label] = type_counts.get(ct_label, 0) + 1
-
-        if type_counts:
-            import pandas as pd
-
-            df = pd.DataFrame(list(type_counts.items()), columns=["유형", "건수"])
-            st.bar_chart(df.set_index("유형"))
+        type_counts = (
+            df["request.content_type"]
+            .map(lambda ct: CONTENT_TYPE_LABELS.get(ct, ct))
+            .value_counts()
+            .rename_axis("유형")
+            .rename("건수")
+        )
+        st.bar_chart(type_counts)
 
     with col2:
         st.subheader("📊 상태 분포")
-        status_counts = {}
-        for item in items:
-            s = item["status"]
-            status_label = STATUS_LABELS.get(s, s)
-            status_counts[status_label] = status_counts.get(status_label, 0) + 1
-
-        if status_counts:
-            import pandas as pd
-
-            df = pd.DataFrame(list(status_counts.items()), columns=["상태", "건수"])
-            st.bar_chart(df.set_index("상태"))
+        status_counts = (
+            df["status"]
+            .map(lambda s: STATUS_LABELS.get(s, s))
+            .value_counts()
+            .rename_axis("상태")
+            .rename("건수")
+        )
+        st.bar_chart(status_counts)
 
     # Recent activity
     st.divider()
@@ -1,5 +1,7 @@
 """Settings page for Content Mate."""
 
+import atexit
+
 import httpx
 import streamlit as st
 
@@ -13,6 +15,17 @@ st.set_page_config(
 API_BASE_URL = "http://localhost:8000/api/v1"
 
 
+@st.cache_resource
+def get_http() -> httpx.Client:
+    """Get the pooled client shared by every rerun of this page.
+
+    No base URL is set because the API address is editable on the page.
+    """
+    client = httpx.Client(timeout=5.0)
+    atexit.register(client.close)
+    return client
+
+
 def main():
     """Settings page main function."""
     st.title("⚙️ 설정")
@@ -66,25 +79,25 @@ def api_settings():
     st.subheader("연결 상태")
 
     try:
-        with httpx.Client(timeout=5.0) as client:
-            # Health check
-            health_response = client.get(f"{api_url}/health")
-            if health_response.status_code == 200:
-                st.success("✅ API 서버: 연결됨")
-
-                # Get API info
-                root_response = client.get(f"{api_url}/")
-                if root_response.status_code == 200:
-                    info = root_response.json()
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("API 이름", info.get("name", "없음"))
-                    with col2:
-                        st.metric("버전", info.get("version", "없음"))
-                    with col3:
-                        st.metric("상태", info.get("status", "없음").title())
-            else:
-                st.error("❌ API 서버: 응답이 올바르지 않습니다")
+        client = get_http()
+        # Health check
+        health_response = client.get(f"{api_url}/health")
+        if health_response.status_code == 200:
+            st.success("✅ API 서버: 연결됨")
+
+            # Get API info
+            root_response = client.get(f"{api_url}/")
+            if root_response.status_code == 200:
+                info = root_response.json()
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("API 이름", info.get("name", "없음"))
+                with col2:
+                    st.metric("버전", info.get("version", "없음"))
+                with col3:
+                    st.metric("상태", info.get("status", "없음").title())
+        else:
+            st.error("❌ API 서버: 응답이 올바르지 않습니다")
     except httpx.ConnectError:
         st.error("❌ API 서버: 연결할 수 없습니다")
         st.info("""
@@ -110,12 +123,11 @@ def test_api_connection(api_url: str):
     """Test API connection."""
     with st.spinner("연결을 테스트 중..."):
         try:
-            with httpx.Client(timeout=5.0) as client:
-                response = client.get(f"{api_url}/health")
-                if response.status_code == 200:
-                    st.success("✅ 연결 성공!")
-                else:
-                    st.error(f"❌ 서버가 상태 코드 {response.status_code}을 반환했습니다")
+            response = get_http().get(f"{api_url}/health")
+            if response.status_code == 200:
+                st.success("✅ 연결 성공!")
+            else:
+                st.error(f"❌ 서버가 상태 코드 {response.status_code}을 반환했습니다")
         except httpx.ConnectError:
             st.error("❌ 서버에 연결할 수 없습니다")
         except Exception as e:
@@ -288,11 +300,10 @@ def about_section():
 
         # Try to get API version
         try:
-            with httpx.Client(timeout=5.0) as client:
-                response = client.get(f"{API_BASE_URL.replace('/api/v1', '')}/")
-                if response.status_code == 200:
-                    info = response.json()
-                    st.metric("API 버전", info.get("version", "없음"))
+            response = get_http().get(f"{API_BASE_URL.replace('/api/v1', '')}/")
+            if response.status_code == 200:
+                info = response.json()
+                st.metric("API 버전", info.get("version", "없음"))
         except Exception:
             st.metric("API 버전", "없음")
 